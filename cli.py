@@ -3,13 +3,18 @@
 
 import sys
 import logging
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
 
 import click
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.spinner import Spinner
+from rich.text import Text
 
 from src.agent import ResearchAgent
 from src.models.data_models import ResearchDepth
@@ -24,6 +29,71 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
+QUIT_COMMANDS = ["quit", "exit", "q"]
+
+# Static renderables, built once and reused across queries
+SPINNER_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+)
+INTERACTIVE_BANNER = Panel.fit(
+    "[bold cyan]Interactive Research Assistant[/bold cyan]\n"
+    "Type your research queries and I'll help you find information.\n"
+    "Type 'quit' or 'exit' to end the session.",
+    border_style="cyan",
+)
+
+# Local batch-API proxy used by --batch-mode; batched calls can take minutes
+BATCH_PROXY_URL = "http://127.0.0.1:3030/v1"
+BATCH_PROXY_TIMEOUT = 3600
+
+
+@lru_cache(maxsize=32)
+def _render_md(body: str) -> Markdown:
+    """Parse a Markdown body once; re-rendering a summary reuses the parse."""
+    return Markdown(body)
+
+
+def _research_batch(
+    agent: ResearchAgent,
+    queries: List[str],
+    depth: str,
+    max_sources: int = 5,
+) -> list:
+    """Research queries back-to-back with one agent, without spinners or prompts."""
+    results = []
+    for query in queries:
+        query = query.strip()
+        if not query:
+            continue
+        
+        console.print(f"\n[bold cyan]Research Query:[/bold cyan] {query}\n")
+        result = agent.research(
+            query=query,
+            research_depth=ResearchDepth(depth),
+            max_sources=max_sources,
+        )
+        console.print(_render_md(result.summary))
+        results.append(result)
+    
+    return results
+
+
+def _save_results(output: str, results: list, depth: str) -> None:
+    """Save research results to a Markdown file."""
+    # Assemble the whole document and write it with one call
+    parts = ["# Research Results\n\n"]
+    for i, result in enumerate(results):
+        if i:
+            parts.append("\n\n---\n\n")
+        parts.append(f"**Query:** {result.query}\n\n")
+        parts.append(f"**Depth:** {depth}\n\n")
+        parts.append(f"**Timestamp:** {result.timestamp.isoformat()}\n\n")
+        parts.append("---\n\n")
+        parts.append(result.summary)
+    
+    Path(output).write_text("".join(parts))
+
 
 @click.group()
 def cli():
@@ -32,7 +102,7 @@ def cli():
 
 
 @cli.command()
-@click.argument("query", nargs=-1, required=True)
+@click.argument("query", nargs=-1)
 @click.option(
     "--depth",
     type=click.Choice(["quick", "standard", "comprehensive"], case_sensitive=False),
@@ -50,21 +120,48 @@ def cli():
     type=click.Path(),
     help="Save results to a file",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the persistent search/webpage cache",
+)
+@click.option(
+    "--batch",
+    "batch_file",
+    type=click.File("r"),
+    help="Research each line of FILE as a separate query, reusing one agent",
+)
+@click.option(
+    "--batch-mode",
+    is_flag=True,
+    help=f"Send OpenAI calls through the batch-API proxy at {BATCH_PROXY_URL}",
+)
 def research(
     query: tuple,
     depth: str,
     max_sources: int,
     output: Optional[str],
+    no_cache: bool,
+    batch_file,
+    batch_mode: bool,
 ):
     """
     Conduct research on a topic.
     
     Example: research "vector databases for RAG applications"
     """
-    query_str = " ".join(query)
+    if not " ".join(query).strip() and not batch_file:
+        raise click.UsageError("Provide a QUERY or --batch FILE.")
+    
+    if batch_file:
+        queries = [line for line in batch_file.read().splitlines() if line.strip()]
+        heading = f"[bold cyan]Batch:[/bold cyan] {len(queries)} queries from {batch_file.name}"
+    else:
+        query_str = " ".join(query)
+        heading = f"[bold cyan]Research Query:[/bold cyan] {query_str}"
     
     console.print(Panel.fit(
-        f"[bold cyan]Research Query:[/bold cyan] {query_str}\n"
+        f"{heading}\n"
         f"[bold cyan]Depth:[/bold cyan] {depth}\n"
         f"[bold cyan]Max Sources:[/bold cyan] {max_sources}",
         title="Research Assistant",
@@ -74,38 +171,42 @@ def research(
     try:
         # Initialize config and agent
         config = get_config()
+        if no_cache:
+            config = config.model_copy(update={"cache_enabled": False})
+        if batch_mode:
+            # Slower but discounted: the proxy groups calls into Batch API jobs
+            config = config.model_copy(update={
+                "openai_base_url": BATCH_PROXY_URL,
+                "openai_timeout": BATCH_PROXY_TIMEOUT,
+            })
         agent = ResearchAgent(config)
         
-        # Conduct research with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Researching...", total=None)
-            
-            result = agent.research(
-                query=query_str,
-                research_depth=ResearchDepth(depth),
-                max_sources=max_sources,
-            )
-            
-            progress.update(task, completed=True)
-        
-        # Display results
-        console.print("\n")
-        console.print(Markdown(result.summary))
+        if batch_file:
+            # One agent (and its API clients) serves every query in the file
+            results = _research_batch(agent, queries, depth, max_sources)
+        else:
+            # Conduct research, showing the summary as plain text while it streams in;
+            # Markdown is parsed once at the end, not on every token delta
+            console.print("\n")
+            with Live(
+                Spinner("dots", text="Researching..."),
+                console=console,
+                refresh_per_second=8,
+            ) as live:
+                result = agent.research(
+                    query=query_str,
+                    research_depth=ResearchDepth(depth),
+                    max_sources=max_sources,
+                    on_text=lambda text: live.update(Text(text)),
+                )
+                
+                # Final Markdown render includes the bibliography
+                live.update(_render_md(result.summary))
+            results = [result]
         
         # Save to file if requested
         if output:
-            with open(output, "w") as f:
-                f.write(f"# Research Results\n\n")
-                f.write(f"**Query:** {query_str}\n\n")
-                f.write(f"**Depth:** {depth}\n\n")
-                f.write(f"**Timestamp:** {result.timestamp.isoformat()}\n\n")
-                f.write("---\n\n")
-                f.write(result.summary)
-            
+            _save_results(output, results, depth)
             console.print(f"\n✓ Results saved to: {output}", style="green")
         
     except ValueError as e:
@@ -120,24 +221,40 @@ def research(
 
 
 @cli.command()
-def interactive():
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the persistent search/webpage cache",
+)
+def interactive(no_cache: bool):
     """Start an interactive research session."""
-    console.print(Panel.fit(
-        "[bold cyan]Interactive Research Assistant[/bold cyan]\n"
-        "Type your research queries and I'll help you find information.\n"
-        "Type 'quit' or 'exit' to end the session.",
-        border_style="cyan",
-    ))
+    console.print(INTERACTIVE_BANNER)
     
     try:
         config = get_config()
+        if no_cache:
+            config = config.model_copy(update={"cache_enabled": False})
         agent = ResearchAgent(config)
         
+        if not sys.stdin.isatty():
+            # Piped input: read all queries in one block and run them back-to-back
+            queries = []
+            for line in sys.stdin.read().splitlines():
+                if line.strip().lower() in QUIT_COMMANDS:
+                    break
+                queries.append(line)
+            
+            _research_batch(agent, queries, "standard")
+            return
+        
+        # One progress display, shown only while each query runs
+        progress = Progress(*SPINNER_COLUMNS, console=console)
+        
         while True:
             console.print("\n")
             query = console.input("[bold green]Research query:[/bold green] ").strip()
             
-            if query.lower() in ["quit", "exit", "q"]:
+            if query.lower() in QUIT_COMMANDS:
                 console.print("Goodbye!", style="cyan")
                 break
             
@@ -152,11 +269,7 @@ def interactive():
             depth = depth_input if depth_input in ["quick", "comprehensive"] else "standard"
             
             # Conduct research
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
+            with progress:
                 task = progress.add_task("Researching...", total=None)
                 
                 result = agent.research(
@@ -164,11 +277,11 @@ def interactive():
                     research_depth=ResearchDepth(depth),
                 )
                 
-                progress.update(task, completed=True)
+                progress.remove_task(task)
             
             # Display results
             console.print("\n")
-            console.print(Markdown(result.summary))
+            console.print(_render_md(result.summary))
             
     except ValueError as e:
         console.print(f"[bold red]Configuration Error:[/bold red] {str(e)}")
@@ -1,17 +1,59 @@
 """Research Assistant Agent using OpenAI Agents SDK."""
 
+import asyncio
 import logging
-from typing import Optional
-from agents import Agent, Runner
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional
+from agents import Agent, ModelSettings, OpenAIProvider, RunConfig, Runner
+from openai import AsyncOpenAI
 
 from .models.data_models import ResearchQuery, ResearchResult, ResearchDepth
-from .tools import web_search, fetch_webpage, init_web_search_tool, init_webpage_fetcher_tool, set_citation_manager
+from .tools import (
+    web_search,
+    web_search_many,
+    fetch_webpage,
+    fetch_webpages,
+    init_web_search_tool,
+    init_webpage_fetcher_tool,
+    set_citation_manager,
+)
 from .utils.config import Config
 from .utils.citation import CitationManager
+from .utils.semantic_cache import get_semantic_cache
+
+if TYPE_CHECKING:
+    from tavily import TavilyClient
 
 logger = logging.getLogger(__name__)
 
 
+# Per-depth guidance included in the research prompt
+DEPTH_INSTRUCTIONS = {
+    ResearchDepth.QUICK: "Do a quick search and provide a brief summary from 2-3 sources.",
+    ResearchDepth.STANDARD: "Search multiple sources and provide a comprehensive summary.",
+    ResearchDepth.COMPREHENSIVE: "Conduct in-depth research across many sources and provide detailed analysis.",
+}
+
+_PROMPT_STEPS = """Please:
+1. Search for relevant information using web_search (or web_search_many to run several sub-queries at once)
+2. Read the most relevant sources using fetch_webpages, passing all chosen URLs in one call (up to {max_sources} sources)
+3. Synthesize the information into a clear, well-organized summary
+4. Cite all sources using [1], [2], etc. format
+5. Provide a sources section at the end
+
+Begin your research now."""
+
+
+@lru_cache(maxsize=16)
+def _research_guidance(research_depth: str, max_sources: int) -> str:
+    """Build the per-query research guidance (cached per depth/max_sources)."""
+    return (
+        f"Research depth: {research_depth}\n"
+        f"{DEPTH_INSTRUCTIONS.get(research_depth, '')}\n\n"
+        + _PROMPT_STEPS.format(max_sources=max_sources)
+    )
+
+
 class ResearchAgent:
     """AI agent for conducting research using OpenAI Agents SDK."""
     
@@ -23,8 +65,9 @@ class ResearchAgent:
 4. Provide well-cited, accurate summaries
 
 When conducting research:
-- Use web_search to find relevant sources
-- Use fetch_webpage to read the full content of promising sources
+- Use web_search to find relevant sources (web_search_many for several queries at once)
+- Use fetch_webpages to read the full content of several promising sources at once
+  (or fetch_webpage for a single source)
 - Cite your sources using [1], [2], etc. format
 - Cross-reference information across multiple sources
 - Present balanced viewpoints when sources disagree
@@ -32,12 +75,17 @@ When conducting research:
 
 Always be thorough, accurate, and transparent about your sources."""
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        tavily_client: Optional["TavilyClient"] = None,
+    ):
         """
         Initialize the research agent.
         
         Args:
             config: Application configuration (uses default if not provided)
+            tavily_client: Tavily client for web search (created from config if not provided)
         """
         from .utils.config import get_config
         
@@ -45,18 +93,32 @@ Always be thorough, accurate, and transparent about your sources."""
         self.citation_manager = CitationManager()
         
         # Initialize tools with configuration
-        init_web_search_tool(self.config)
+        init_web_search_tool(self.config, tavily_client)
         init_webpage_fetcher_tool(self.config)
         set_citation_manager(self.citation_manager)
         
-        # Create the agent with tools
-        self.agent = None  # Will be created per research call with custom instructions
+        # Optional cache of earlier results for similar queries
+        self.semantic_cache = get_semantic_cache(self.config)
+        
+        # Create the agent once; per-query guidance is passed in the run input
+        self.agent = Agent(
+            name="Research Assistant",
+            instructions=self.SYSTEM_PROMPT,
+            tools=[web_search, web_search_many, fetch_webpage, fetch_webpages],
+            model=self.config.agent_model,
+            # Let the model issue several tool calls per turn; the async tools
+            # are then executed concurrently by the SDK.
+            # Note: temperature can also be set via model_settings if needed
+            model_settings=ModelSettings(parallel_tool_calls=True),
+        )
+        self.run_config = self._create_run_config()
     
     def research(
         self,
         query: str,
         research_depth: ResearchDepth = ResearchDepth.STANDARD,
         max_sources: int = 5,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> ResearchResult:
         """
         Conduct research on a given query.
@@ -65,54 +127,83 @@ Always be thorough, accurate, and transparent about your sources."""
             query: Research question or topic
             research_depth: How deep to research
             max_sources: Maximum number of sources to consult
+            on_text: Optional callback enabling streaming; called with the
+                partial summary text each time a new chunk arrives
             
         Returns:
             Research results with summary and citations
         """
+        # Nothing to research: skip validation and the model round-trip
+        if not query or not query.strip() or max_sources < 1:
+            return ResearchResult(
+                query=query,
+                summary="",
+                sources_consulted=[],
+                research_depth=research_depth,
+            )
+        
         research_query = ResearchQuery(
             query=query,
             research_depth=research_depth,
             max_sources=max_sources,
         )
         
+        # Reuse earlier research on a sufficiently similar query
+        embedding = None
+        if self.semantic_cache:
+            embedding = self.semantic_cache.embed(query)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(
+                    embedding,
+                    research_query.research_depth,
+                    research_query.max_sources,
+                )
+                if cached:
+                    return cached.model_copy(update={"query": query})
+        
         logger.info(f"Starting research on: {query}")
         self.citation_manager.clear()
         
-        # Create custom instructions for this research query
-        instructions = self._create_research_instructions(research_query)
-        
-        # Create agent for this research
-        agent = Agent(
-            name="Research Assistant",
-            instructions=instructions,
-            tools=[web_search, fetch_webpage],
-            model=self.config.agent_model,
-            # Note: temperature is set via model_settings if needed
-        )
+        research_input = self._create_research_prompt(research_query)
         
         # Run the agent using Runner
         try:
-            result = Runner.run_sync(
-                agent,
-                input=f"Research the following topic: {query}",
-                max_turns=10,  # Equivalent to max_iterations
-            )
+            if on_text is None:
+                result = Runner.run_sync(
+                    self.agent,
+                    input=research_input,
+                    max_turns=10,  # Equivalent to max_iterations
+                    run_config=self.run_config,
+                )
+            else:
+                result = asyncio.run(self._run_streamed(self.agent, research_input, on_text))
             
             logger.info("Research complete")
             
             # Extract the final output
             summary = result.final_output if hasattr(result, 'final_output') else str(result)
             
-            # Get sources from citation manager
+            # Get sources and bibliography from citation manager
             sources_consulted = [citation.url for citation in self.citation_manager.citations]
+            bibliography = self.citation_manager.format_bibliography()
             
-            return ResearchResult(
+            research_result = ResearchResult(
                 query=query,
-                summary=summary + "\n\n" + self.citation_manager.format_bibliography(),
+                summary="\n\n".join((summary, bibliography)),
                 sources_consulted=sources_consulted,
                 research_depth=research_depth,
             )
             
+            if embedding is not None:
+                self.semantic_cache.store(
+                    embedding,
+                    research_query.research_depth,
+                    research_query.max_sources,
+                    research_result,
+                )
+            
+            return research_result
+            
         except Exception as e:
             logger.error(f"Research failed: {str(e)}")
             # Return error result
@@ -123,27 +214,46 @@ Always be thorough, accurate, and transparent about your sources."""
                 research_depth=research_depth,
             )
     
-    def _create_research_instructions(self, query: ResearchQuery) -> str:
-        """Create the research instructions for the agent."""
-        depth_instructions = {
-            ResearchDepth.QUICK: "Do a quick search and provide a brief summary from 2-3 sources.",
-            ResearchDepth.STANDARD: "Search multiple sources and provide a comprehensive summary.",
-            ResearchDepth.COMPREHENSIVE: "Conduct in-depth research across many sources and provide detailed analysis.",
-        }
+    async def _run_streamed(
+        self,
+        agent: Agent,
+        research_input: str,
+        on_text: Callable[[str], None],
+    ):
+        """Run the agent in streaming mode, reporting partial text to ``on_text``."""
+        result = Runner.run_streamed(
+            agent,
+            input=research_input,
+            max_turns=10,
+            run_config=self.run_config,
+        )
         
-        custom_instructions = f"""
-{self.SYSTEM_PROMPT}
-
-Research depth: {query.research_depth}
-{depth_instructions.get(query.research_depth, "")}
-
-Please:
-1. Search for relevant information using web_search
-2. Read the most relevant sources using fetch_webpage (up to {query.max_sources} sources)
-3. Synthesize the information into a clear, well-organized summary
-4. Cite all sources using [1], [2], etc. format
-5. Provide a sources section at the end
-
-Begin your research now."""
+        text = ""
+        async for event in result.stream_events():
+            if event.type != "raw_response_event":
+                continue
+            if event.data.type == "response.created":
+                # Each model response (e.g. after a round of tool calls) starts fresh
+                text = ""
+            elif event.data.type == "response.output_text.delta":
+                text += event.data.delta
+                on_text(text)
+        
+        return result
+    
+    def _create_run_config(self) -> Optional[RunConfig]:
+        """Route model calls to a custom OpenAI-compatible endpoint, if configured."""
+        if not self.config.openai_base_url:
+            return None
         
-        return custom_instructions
+        client = AsyncOpenAI(
+            api_key=self.config.openai_api_key,
+            base_url=self.config.openai_base_url,
+            timeout=self.config.openai_timeout,
+        )
+        return RunConfig(model_provider=OpenAIProvider(openai_client=client))
+    
+    def _create_research_prompt(self, query: ResearchQuery) -> str:
+        """Create the run input for a research query."""
+        guidance = _research_guidance(query.research_depth, query.max_sources)
+        return f"Research the following topic: {query.query}\n\n{guidance}"
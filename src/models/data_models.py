@@ -1,9 +1,10 @@
 """Pydantic data models for the research assistant."""
 
+import time
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 
 class ResearchDepth(str, Enum):
@@ -36,19 +37,12 @@ class ResearchQuery(BaseModel):
 class SearchResult(BaseModel):
     """A single search result from a search engine."""
     
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     url: str
     title: str
     snippet: str
     score: Optional[float] = None
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "url": self.url,
-            "title": self.title,
-            "snippet": self.snippet,
-            "score": self.score,
-        }
 
 
 class WebpageContent(BaseModel):
@@ -59,27 +53,35 @@ class WebpageContent(BaseModel):
     content: str
     author: Optional[str] = None
     published_date: Optional[str] = None
-    extracted_at: datetime = Field(default_factory=datetime.now)
+    # Stored as an epoch float; formatted only when the model is serialized
+    extracted_at_ts: float = Field(default_factory=time.time, exclude=True, repr=False)
     success: bool = True
     error: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "url": self.url,
-            "title": self.title,
-            "content": self.content,
-            "author": self.author,
-            "published_date": self.published_date,
-            "extracted_at": self.extracted_at.isoformat(),
-            "success": self.success,
-            "error": self.error,
-        }
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_extracted_at(cls, data: Any) -> Any:
+        """Accept `extracted_at` (a datetime or ISO string) as input for the timestamp."""
+        if isinstance(data, dict) and "extracted_at" in data:
+            data = dict(data)
+            extracted_at = data.pop("extracted_at")
+            if isinstance(extracted_at, str):
+                extracted_at = datetime.fromisoformat(extracted_at)
+            data.setdefault("extracted_at_ts", extracted_at.timestamp())
+        return data
+    
+    @computed_field
+    @property
+    def extracted_at(self) -> datetime:
+        """Extraction time as a local datetime (an ISO string in JSON output)."""
+        return datetime.fromtimestamp(self.extracted_at_ts)
 
 
 class Finding(BaseModel):
     """A key finding from research."""
     
+    model_config = ConfigDict(frozen=True)
+    
     claim: str
     evidence: str
     source_urls: List[str]
@@ -89,21 +91,12 @@ class Finding(BaseModel):
 class ResearchResult(BaseModel):
     """The result of a research query."""
     
+    model_config = ConfigDict(frozen=True)
+    
     query: str
     summary: str
     key_findings: List[Finding] = Field(default_factory=list)
     sources_consulted: List[str] = Field(default_factory=list)
     research_depth: ResearchDepth
     timestamp: datetime = Field(default_factory=datetime.now)
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "query": self.query,
-            "summary": self.summary,
-            "key_findings": [f.dict() for f in self.key_findings],
-            "sources_consulted": self.sources_consulted,
-            "research_depth": self.research_depth,
-            "timestamp": self.timestamp.isoformat(),
-        }
 
@@ -1,11 +1,18 @@
 """Tools for the research assistant agent using OpenAI Agents SDK."""
 
-from .web_search import web_search, init_web_search_tool
-from .webpage_fetcher import fetch_webpage, init_webpage_fetcher_tool, set_citation_manager
+from .web_search import web_search, web_search_many, init_web_search_tool
+from .webpage_fetcher import (
+    fetch_webpage,
+    fetch_webpages,
+    init_webpage_fetcher_tool,
+    set_citation_manager,
+)
 
 __all__ = [
     "web_search",
+    "web_search_many",
     "fetch_webpage",
+    "fetch_webpages",
     "init_web_search_tool",
     "init_webpage_fetcher_tool",
     "set_citation_manager",
@@ -1,26 +1,37 @@
 """Web search tool using Tavily API with OpenAI Agents SDK."""
 
-import json
+import asyncio
 import logging
-from typing import Optional
-from tavily import TavilyClient
+from typing import TYPE_CHECKING, List, Optional
+import orjson
 from agents import function_tool
 
-from ..models.data_models import SearchResult
 from ..utils.config import Config
+from ..utils.cache import ResultCache, get_cache
+
+if TYPE_CHECKING:
+    from tavily import TavilyClient
 
 logger = logging.getLogger(__name__)
 
 # Global reference to config and client (will be set by init function)
 _config: Optional[Config] = None
-_tavily_client: Optional[TavilyClient] = None
+_tavily_client: Optional["TavilyClient"] = None
+_cache: Optional[ResultCache] = None
+
+
+def _create_client(config: Config) -> "TavilyClient":
+    """Create a Tavily client, importing the SDK only when one is needed."""
+    from tavily import TavilyClient
+    return TavilyClient(api_key=config.tavily_api_key)
 
 
-def init_web_search_tool(config: Config):
-    """Initialize the web search tool with configuration."""
-    global _config, _tavily_client
+def init_web_search_tool(config: Config, client: Optional["TavilyClient"] = None):
+    """Initialize the web search tool with configuration and an optional Tavily client."""
+    global _config, _tavily_client, _cache
     _config = config
-    _tavily_client = TavilyClient(api_key=config.tavily_api_key)
+    _tavily_client = client or _create_client(config)
+    _cache = get_cache(config)
 
 
 def _web_search_impl(query: str, max_results: int = 5) -> str:
@@ -35,15 +46,24 @@ def _web_search_impl(query: str, max_results: int = 5) -> str:
         JSON string with search results
     """
     if not query or not query.strip():
-        return json.dumps({
+        return orjson.dumps({
             "success": False,
             "error": "Query cannot be empty",
             "results": []
-        })
+        }).decode()
     
     # Use global config if available, otherwise use defaults
     if _config:
         max_results = max_results or _config.max_search_results
+    max_results = min(max(1, max_results), 10)  # Clamp between 1 and 10
+    
+    # Serve repeated searches from the persistent cache
+    cache_key = f"{query}\0{max_results}"
+    if _cache:
+        cached = _cache.get("web_search", cache_key)
+        if cached is not None:
+            logger.info(f"Cache hit for web search: {query}")
+            return cached
     
     try:
         logger.info(f"Executing web search for: {query}")
@@ -53,48 +73,53 @@ def _web_search_impl(query: str, max_results: int = 5) -> str:
         if not client:
             # Fallback: create client if not initialized
             from ..utils.config import get_config
-            config = get_config()
-            client = TavilyClient(api_key=config.tavily_api_key)
+            client = _create_client(get_config())
         
         # Execute Tavily search
         response = client.search(
             query=query,
-            max_results=min(max(1, max_results), 10),  # Clamp between 1 and 10
+            max_results=max_results,
             search_depth="basic",
             include_answer=False,
         )
         
-        # Parse results
-        results = []
-        for item in response.get("results", []):
-            result = SearchResult(
-                url=item.get("url", ""),
-                title=item.get("title", ""),
-                snippet=item.get("content", ""),
-                score=item.get("score"),
-            )
-            results.append(result)
+        # Map results straight to the output shape (see SearchResult);
+        # they are serialized immediately, so skip model validation
+        results = [
+            {
+                "url": item.get("url", ""),
+                "title": item.get("title", ""),
+                "snippet": item.get("content", ""),
+                "score": item.get("score"),
+            }
+            for item in response.get("results", [])
+        ]
         
         logger.info(f"Found {len(results)} results")
         
-        return json.dumps({
+        result_json = orjson.dumps({
             "success": True,
             "query": query,
-            "results": [r.to_dict() for r in results],
+            "results": results,
             "count": len(results),
-        })
+        }).decode()
+        
+        if _cache:
+            _cache.set("web_search", cache_key, result_json)
+        
+        return result_json
         
     except Exception as e:
         logger.error(f"Web search failed: {str(e)}")
-        return json.dumps({
+        return orjson.dumps({
             "success": False,
             "error": str(e),
             "results": [],
-        })
+        }).decode()
 
 
 @function_tool
-def web_search(query: str, max_results: int = 5) -> str:
+async def web_search(query: str, max_results: int = 5) -> str:
     """
     Search the web for information on a given query.
     
@@ -108,4 +133,43 @@ def web_search(query: str, max_results: int = 5) -> str:
     Returns:
         JSON string with search results containing success status, query, results list, and count
     """
-    return _web_search_impl(query, max_results)
+    # Run the blocking HTTP call off the event loop so the SDK can execute
+    # several tool calls from the same turn concurrently.
+    return await asyncio.to_thread(_web_search_impl, query, max_results)
+
+
+async def _web_search_many_impl(queries: List[str], max_results: int = 5) -> str:
+    """
+    Run several searches concurrently.
+    
+    Args:
+        queries: The search queries to execute
+        max_results: Maximum number of results to return per query
+        
+    Returns:
+        JSON array with one web_search result per distinct query, in order
+    """
+    results = await asyncio.gather(*(
+        asyncio.to_thread(_web_search_impl, query, max_results)
+        for query in dict.fromkeys(queries)
+    ))
+    return "[" + ",".join(results) + "]"
+
+
+@function_tool
+async def web_search_many(queries: List[str], max_results: int = 5) -> str:
+    """
+    Search the web for several queries at once.
+    
+    Prefer this over repeated web_search calls when exploring a topic through
+    multiple sub-queries: all searches run concurrently.
+    
+    Args:
+        queries: The search queries to execute
+        max_results: Maximum number of results to return per query (default: 5, min: 1, max: 10)
+        
+    Returns:
+        JSON array with one result per distinct query, in first-seen order (duplicates are
+        searched once), each containing success status, query, results list, and count
+    """
+    return await _web_search_many_impl(queries, max_results)
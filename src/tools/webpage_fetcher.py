@@ -1,32 +1,198 @@
 """Webpage fetching and content extraction tool with OpenAI Agents SDK."""
 
-import json
+import asyncio
+import codecs
 import logging
-from typing import Optional
+import re
+import socket
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import List, Optional, Tuple
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 from agents import function_tool
 
 from ..models.data_models import WebpageContent
-from ..utils.config import Config
+from ..utils.config import Config, get_config
 from ..utils.citation import Citation
+from ..utils.cache import ResultCache, get_cache
 
 logger = logging.getLogger(__name__)
 
+# Feed parsers per worker thread (one per declared charset), reused for every
+# page it fetches; comments and blank text nodes never reach the tree
+_parsers = threading.local()
+
+# Charset declared in a Content-Type header
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+# Charset declared in the page itself (<meta charset> or http-equiv), looked
+# for within the first SNIFF_BYTES of the body, as browsers do
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=", re.IGNORECASE)
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+SNIFF_BYTES = 1024
+
+# Pages are parsed while they download; stop reading after this many bytes
+# (the extracted content is capped at 5000 characters anyway)
+CHUNK_SIZE = 64 * 1024
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Compiled XPath queries; each field is matched in C in priority order
+# The title almost always sits in <head>; only scan the whole tree if it does not
+_XP_HEAD_TITLE = etree.XPath("string(/html/head/title)")
+_XP_TITLE = etree.XPath("string(//title)")
+_XP_H1 = etree.XPath("string((//h1)[1])")
+_XP_MAIN_CONTENT = [
+    etree.XPath("(//main)[1]"),
+    etree.XPath("(//article)[1]"),
+    etree.XPath(
+        "(//div[contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        "'abcdefghijklmnopqrstuvwxyz'), 'content')])[1]"
+    ),
+    etree.XPath("(//body)[1]"),
+]
+# Elements removed before content extraction
+_UNWANTED_TAGS = ("script", "style", "noscript", "iframe", "nav", "header", "footer", "aside")
+# All <meta> tags are collected in one scan; fields are then picked by key
+_XP_META = etree.XPath("//meta[@content]")
+_META_ATTRIBUTES = ("name", "property", "itemprop")
+_AUTHOR_META = [("name", "author")]
+_PUBLISHED_DATE_META = [
+    ("property", "article:published_time"),
+    ("name", "publishdate"),
+    ("name", "date"),
+    ("itemprop", "datePublished"),
+]
+_XP_AUTHOR_SPAN = etree.XPath("string((//span[@itemprop='author'])[1])")
+_XP_TIME = etree.XPath("string((//time)[1]/@datetime)")
+
+# Extracted page text is cut to this many characters
+MAX_CONTENT_LENGTH = 5000
+
+# Whitespace around line breaks, including blank lines in between
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+
+# Keep-alive pool sizing: distinct hosts kept, and connections per host
+POOL_CONNECTIONS = 100
+POOL_MAXSIZE = 50
+
+# Retry failed connections and gateway errors with a short backoff; read
+# timeouts are not retried, so a slow page costs at most one request_timeout
+FETCH_RETRIES = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
 # Global references (will be set by init function)
 _config: Optional[Config] = None
 _session: Optional[requests.Session] = None
 _citation_manager = None  # Will be set by agent
+_cache: Optional[ResultCache] = None
+
+# Validators (ETag, Last-Modified) and results of recently fetched pages,
+# used to revalidate them with a conditional GET instead of re-downloading
+MAX_REVALIDATION_ENTRIES = 256
+# With the result cache enabled they are also persisted, and outlive the cached
+# page itself, so later runs can revalidate pages whose cache entry expired
+REVALIDATION_NAMESPACE = "fetch_webpage_validators"
+REVALIDATION_TTL = 30 * 24 * 60 * 60
+_revalidation: "OrderedDict[str, Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+_revalidation_lock = threading.Lock()
 
 
 def init_webpage_fetcher_tool(config: Config):
     """Initialize the webpage fetcher tool with configuration."""
-    global _config, _session
+    global _config, _session, _cache
     _config = config
-    _session = requests.Session()
-    _session.headers.update({
+    _cache = get_cache(config)
+    _session = _create_session(config)
+    if config.dns_cache_enabled:
+        _enable_dns_cache()
+    else:
+        _disable_dns_cache()
+
+
+def _get_session() -> Tuple[Config, requests.Session]:
+    """Get the shared config and session, creating them once if the tool was not initialized."""
+    global _config, _session
+    if _config is None or _session is None:
+        _config = get_config()
+        _session = _create_session(_config)
+    return _config, _session
+
+
+_original_getaddrinfo = socket.getaddrinfo
+
+# Answers of the DNS cache, per lookup arguments, as (expiry, result); entries
+# expire after DNS_CACHE_TTL seconds so changed DNS records are picked up
+DNS_CACHE_TTL = 300
+MAX_DNS_CACHE_ENTRIES = 1024
+_dns_cache: "OrderedDict[tuple, Tuple[float, list]]" = OrderedDict()
+_dns_cache_lock = threading.Lock()
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    """socket.getaddrinfo with each answer reused for DNS_CACHE_TTL seconds."""
+    key = (args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _dns_cache.move_to_end(key)
+            return entry[1]
+    
+    result = _original_getaddrinfo(*args, **kwargs)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+        _dns_cache.move_to_end(key)
+        while len(_dns_cache) > MAX_DNS_CACHE_ENTRIES:
+            _dns_cache.popitem(last=False)
+    return result
+
+
+def _enable_dns_cache() -> None:
+    """
+    Reuse host lookups for DNS_CACHE_TTL seconds, so connections to known hosts
+    skip the DNS round trip.
+    
+    This replaces socket.getaddrinfo for the whole process, so it also applies
+    to the OpenAI and Tavily clients and any other socket user.
+    """
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+def _disable_dns_cache() -> None:
+    """Restore the original socket.getaddrinfo and drop cached answers."""
+    if socket.getaddrinfo is _cached_getaddrinfo:
+        socket.getaddrinfo = _original_getaddrinfo
+    with _dns_cache_lock:
+        _dns_cache.clear()
+
+
+def _create_session(config: Config) -> requests.Session:
+    """Create a session that keeps connections alive across fetches."""
+    session = requests.Session()
+    # Accept-Encoding keeps requests' default, which includes br when brotli is installed
+    session.headers.update({
         "User-Agent": config.user_agent,
+        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
     })
+    # Concurrent fetches from one turn share (and reuse) pooled connections
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=FETCH_RETRIES,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def set_citation_manager(citation_manager):
@@ -35,89 +201,236 @@ def set_citation_manager(citation_manager):
     _citation_manager = citation_manager
 
 
-def _extract_title(soup: BeautifulSoup) -> str:
-    """Extract page title."""
-    # Try <title> tag first
-    if soup.title and soup.title.string:
-        return soup.title.string.strip()
+def _track_citation(page: WebpageContent) -> None:
+    """Record a fetched page with the citation manager, if one is set."""
+    if _citation_manager:
+        citation = Citation(
+            url=page.url,
+            title=page.title,
+            snippet=page.content[:200] if page.content else None,
+            author=page.author,
+            published_date=page.published_date,
+        )
+        _citation_manager.add_citation(citation)
+
+
+def _get_revalidation(url: str) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+    """Look up the validators and result of a previously fetched page."""
+    with _revalidation_lock:
+        entry = _revalidation.get(url)
+        if entry is not None:
+            _revalidation.move_to_end(url)
+            return entry
+    
+    # Fall back to validators persisted by an earlier run
+    stored = _cache.get(REVALIDATION_NAMESPACE, url) if _cache else None
+    if stored is None:
+        return None
+    entry = tuple(orjson.loads(stored))
+    _remember_revalidation(url, entry)
+    return entry
+
+
+def _remember_revalidation(url: str, entry: Tuple[Optional[str], Optional[str], str]) -> None:
+    """Keep a revalidation entry in memory, evicting the least recently used."""
+    with _revalidation_lock:
+        _revalidation[url] = entry
+        _revalidation.move_to_end(url)
+        while len(_revalidation) > MAX_REVALIDATION_ENTRIES:
+            _revalidation.popitem(last=False)
+
+
+def _store_revalidation(
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    result_json: str,
+) -> None:
+    """Remember a page's validators and result, in memory and in the result cache."""
+    if not etag and not last_modified:
+        # Drop validators from an earlier fetch, or a later 304 would serve that stale result
+        with _revalidation_lock:
+            _revalidation.pop(url, None)
+        if _cache:
+            _cache.delete(REVALIDATION_NAMESPACE, url)
+        return
     
-    # Try h1
-    h1 = soup.find("h1")
-    if h1:
-        return h1.get_text().strip()
+    entry = (etag, last_modified, result_json)
+    _remember_revalidation(url, entry)
+    if _cache:
+        _cache.set(REVALIDATION_NAMESPACE, url, orjson.dumps(entry).decode(), ttl=REVALIDATION_TTL)
+
+
+def _get_parser(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """Get this thread's feed parser for a charset (None lets lxml detect it)."""
+    parsers = getattr(_parsers, "by_encoding", None)
+    if parsers is None:
+        parsers = _parsers.by_encoding = {}
     
-    return "Untitled"
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml_html.HTMLParser(
+            remove_blank_text=True,
+            remove_comments=True,
+            encoding=encoding,
+        )
+    return parser
 
 
-def _extract_content(soup: BeautifulSoup) -> str:
-    """Extract main content from the page."""
-    # Remove unwanted elements
-    for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
-        element.decompose()
+def _sniff_encoding(head: bytes) -> Optional[str]:
+    """Charset for a page whose headers declare none (None lets lxml read its BOM or <meta charset>)."""
+    if head.startswith(_BOMS) or _META_CHARSET_RE.search(head[:SNIFF_BYTES]):
+        return None
+    # lxml would otherwise assume Latin-1; undeclared pages are mostly UTF-8
+    return "utf-8"
+
+
+def _parse_response(response: requests.Response) -> Optional[lxml_html.HtmlElement]:
+    """Feed the response body to an HTML parser chunk by chunk as it arrives (None if it is empty)."""
+    chunks = response.iter_content(CHUNK_SIZE)
+    first = next(chunks, b"")
     
-    # Try to find main content area
-    main_content = (
-        soup.find("main") or
-        soup.find("article") or
-        soup.find("div", class_=lambda x: x and "content" in x.lower()) or
-        soup.find("body")
-    )
+    # Decode with the charset from the headers when the server declares a
+    # known one; otherwise go by what the start of the body declares
+    match = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    try:
+        parser = _get_parser(match.group(1).lower() if match else _sniff_encoding(first))
+    except LookupError:
+        parser = _get_parser(_sniff_encoding(first))
     
-    if not main_content:
-        return ""
+    received = 0
+    try:
+        for chunk in chain((first,), chunks):
+            parser.feed(chunk)
+            received += len(chunk)
+            if received >= MAX_PAGE_BYTES:
+                logger.info(f"Truncated page download at {received} bytes")
+                break
+    except Exception:
+        # Reset the parser so the next page starts from a clean state
+        try:
+            parser.close()
+        except etree.LxmlError:
+            pass
+        raise
     
-    # Extract text
-    text = main_content.get_text(separator="\n", strip=True)
+    try:
+        return parser.close()
+    except etree.XMLSyntaxError:
+        # An empty body leaves lxml without a document
+        return None
+
+
+def _read_plain_text(response: requests.Response, content_type: str) -> str:
+    """Read a text/plain body: no markup to parse, just decode, tidy and truncate."""
+    match = _CHARSET_RE.search(content_type)
+    encoding = match.group(1) if match else "utf-8"
     
-    # Clean up whitespace
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    text = "\n".join(lines)
+    # Enough bytes for MAX_CONTENT_LENGTH characters even at 4 bytes each
+    limit = min(4 * (MAX_CONTENT_LENGTH + 1), MAX_PAGE_BYTES)
+    body = bytearray()
+    for chunk in response.iter_content(CHUNK_SIZE):
+        body += chunk
+        if len(body) >= limit:
+            break
     
-    # Limit length (keep first 5000 characters to avoid token limits)
-    if len(text) > 5000:
-        text = text[:5000] + "..."
+    try:
+        text = body.decode(encoding, errors="replace")
+    except LookupError:
+        text = body.decode("utf-8", errors="replace")
     
+    text = _LINE_BREAK_RE.sub("\n", text).strip()
+    if len(text) > MAX_CONTENT_LENGTH:
+        text = text[:MAX_CONTENT_LENGTH] + "..."
     return text
 
 
-def _extract_author(soup: BeautifulSoup) -> Optional[str]:
-    """Extract author from metadata."""
-    # Try meta tags
-    author_meta = soup.find("meta", attrs={"name": "author"})
-    if author_meta and author_meta.get("content"):
-        return author_meta["content"].strip()
-    
-    # Try schema.org
-    author_span = soup.find("span", attrs={"itemprop": "author"})
-    if author_span:
-        return author_span.get_text().strip()
-    
+def _first_match(tree: lxml_html.HtmlElement, queries: list) -> Optional[str]:
+    """Return the first non-empty string result of the given XPath queries."""
+    for query in queries:
+        value = query(tree).strip()
+        if value:
+            return value
     return None
 
 
-def _extract_published_date(soup: BeautifulSoup) -> Optional[str]:
-    """Extract published date from metadata."""
-    # Try various meta tags
-    date_tags = [
-        ("property", "article:published_time"),
-        ("name", "publishdate"),
-        ("name", "date"),
-        ("itemprop", "datePublished"),
-    ]
+def _extract_title(tree: lxml_html.HtmlElement) -> str:
+    """Extract page title."""
+    # Try <title> tag first, then the first h1
+    return _first_match(tree, [_XP_HEAD_TITLE, _XP_TITLE, _XP_H1]) or "Untitled"
+
+
+def _extract_content(tree: lxml_html.HtmlElement) -> str:
+    """Extract main content from the page."""
+    # Remove unwanted elements in one C-level pass (their tail text stays in place)
+    etree.strip_elements(tree, *_UNWANTED_TAGS, with_tail=False)
     
-    for attr_name, attr_value in date_tags:
-        meta = soup.find("meta", attrs={attr_name: attr_value})
-        if meta and meta.get("content"):
-            return meta["content"].strip()
+    # Try to find main content area
+    main_content = None
+    for query in _XP_MAIN_CONTENT:
+        matches = query(tree)
+        if matches:
+            main_content = matches[0]
+            break
     
-    # Try time tag
-    time_tag = soup.find("time")
-    if time_tag and time_tag.get("datetime"):
-        return time_tag["datetime"].strip()
+    if main_content is None:
+        return ""
     
+    # Extract text, one line per text node with whitespace cleaned up, and
+    # stop as soon as there is more than the length limit
+    parts = []
+    length = -1  # no separator before the first part
+    for piece in main_content.itertext():
+        # The regex only has work to do on text spanning several lines
+        if "\n" in piece:
+            piece = _LINE_BREAK_RE.sub("\n", piece)
+        piece = piece.strip()
+        if piece:
+            parts.append(piece)
+            length += len(piece) + 1
+            if length > MAX_CONTENT_LENGTH:
+                break
+    text = "\n".join(parts)
+    
+    # Limit length (keep first 5000 characters to avoid token limits)
+    if len(text) > MAX_CONTENT_LENGTH:
+        text = text[:MAX_CONTENT_LENGTH] + "..."
+    
+    return text
+
+
+def _collect_meta(tree: lxml_html.HtmlElement) -> dict:
+    """Map each (attribute, value) of the page's <meta> tags to its first non-empty content."""
+    meta = {}
+    for element in _XP_META(tree):
+        content = element.get("content").strip()
+        if not content:
+            continue
+        for attribute in _META_ATTRIBUTES:
+            value = element.get(attribute)
+            if value is not None:
+                meta.setdefault((attribute, value), content)
+    return meta
+
+
+def _first_meta(meta: dict, keys: list) -> Optional[str]:
+    """Return the content of the first meta key present, in priority order."""
+    for key in keys:
+        if key in meta:
+            return meta[key]
     return None
 
 
+def _extract_author(tree: lxml_html.HtmlElement, meta: dict) -> Optional[str]:
+    """Extract author from metadata (meta tag, then schema.org)."""
+    return _first_meta(meta, _AUTHOR_META) or _first_match(tree, [_XP_AUTHOR_SPAN])
+
+
+def _extract_published_date(tree: lxml_html.HtmlElement, meta: dict) -> Optional[str]:
+    """Extract published date from meta tags or a <time> tag."""
+    return _first_meta(meta, _PUBLISHED_DATE_META) or _first_match(tree, [_XP_TIME])
+
+
 def _fetch_webpage_impl(url: str) -> str:
     """
     Implementation of fetch_webpage (not decorated, for testing).
@@ -129,47 +442,81 @@ def _fetch_webpage_impl(url: str) -> str:
         JSON string with extracted content
     """
     if not url or not url.strip():
-        return json.dumps({
+        return orjson.dumps({
             "success": False,
             "error": "URL cannot be empty",
-        })
+        }).decode()
     
-    # Get config and session
-    config = _config
-    session = _session
+    # Serve previously fetched pages from the persistent cache
+    if _cache:
+        cached = _cache.get("fetch_webpage", url)
+        if cached is not None:
+            logger.info(f"Cache hit for webpage: {url}")
+            _track_citation(WebpageContent.model_validate_json(cached))
+            return cached
     
-    if not config or not session:
-        # Fallback: create if not initialized
-        from ..utils.config import get_config
-        config = get_config()
-        session = requests.Session()
-        session.headers.update({"User-Agent": config.user_agent})
+    config, session = _get_session()
     
     try:
         logger.info(f"Fetching webpage: {url}")
         
-        # Fetch the page
+        # Revalidate a previously fetched page instead of downloading it again
+        revalidation = _get_revalidation(url)
+        headers = {}
+        if revalidation:
+            etag, last_modified, _ = revalidation
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        # Fetch the page, streaming the body into the parser
         response = session.get(
             url,
+            headers=headers,
             timeout=config.request_timeout,
             allow_redirects=True,
+            stream=True,
         )
-        response.raise_for_status()
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.content, "lxml")
-        
-        # Extract title
-        title = _extract_title(soup)
         
-        # Extract main content
-        content = _extract_content(soup)
+        try:
+            if revalidation and response.status_code == 304:
+                logger.info(f"Webpage not modified: {url}")
+                result_json = revalidation[2]
+                _track_citation(WebpageContent.model_validate_json(result_json))
+                if _cache:
+                    _cache.set("fetch_webpage", url, result_json)
+                return result_json
+            
+            response.raise_for_status()
+            
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith("text/plain"):
+                # Plain text skips HTML parsing entirely
+                tree = None
+                content = _read_plain_text(response, content_type)
+            else:
+                # Parse HTML once; every extractor runs compiled XPath on this tree
+                tree = _parse_response(response)
+                content = ""  # kept if the body turns out to be empty
+        finally:
+            # Return the connection to the pool even if the body was not fully read
+            response.close()
         
-        # Extract metadata
-        author = _extract_author(soup)
-        published_date = _extract_published_date(soup)
+        if tree is None:
+            title, author, published_date = "Untitled", None, None
+        else:
+            # Extract title and metadata (before content extraction prunes the tree)
+            title = _extract_title(tree)
+            meta = _collect_meta(tree)
+            author = _extract_author(tree, meta)
+            published_date = _extract_published_date(tree, meta)
+            
+            # Extract main content
+            content = _extract_content(tree)
         
-        webpage_content = WebpageContent(
+        # Every field comes from our own extractors, so skip validation
+        webpage_content = WebpageContent.model_construct(
             url=url,
             title=title,
             content=content,
@@ -181,43 +528,46 @@ def _fetch_webpage_impl(url: str) -> str:
         logger.info(f"Successfully extracted content from {url}")
         
         # Track citation if manager is available
-        if _citation_manager:
-            citation = Citation(
-                url=url,
-                title=title,
-                snippet=content[:200] if content else None,
-                author=author,
-                published_date=published_date,
-            )
-            _citation_manager.add_citation(citation)
+        _track_citation(webpage_content)
+        
+        # Serialize straight to JSON (no intermediate dict)
+        result_json = webpage_content.model_dump_json()
+        if _cache:
+            _cache.set("fetch_webpage", url, result_json)
+        _store_revalidation(
+            url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            result_json,
+        )
         
-        return json.dumps(webpage_content.to_dict())
+        return result_json
         
     except requests.exceptions.Timeout:
         logger.error(f"Timeout fetching {url}")
-        return json.dumps({
+        return orjson.dumps({
             "success": False,
             "error": "Request timeout",
             "url": url,
-        })
+        }).decode()
     except requests.exceptions.HTTPError as e:
         logger.error(f"HTTP error fetching {url}: {e}")
-        return json.dumps({
+        return orjson.dumps({
             "success": False,
             "error": f"HTTP {e.response.status_code}",
             "url": url,
-        })
+        }).decode()
     except Exception as e:
         logger.error(f"Error fetching {url}: {str(e)}")
-        return json.dumps({
+        return orjson.dumps({
             "success": False,
             "error": str(e),
             "url": url,
-        })
+        }).decode()
 
 
 @function_tool
-def fetch_webpage(url: str) -> str:
+async def fetch_webpage(url: str) -> str:
     """
     Fetch and extract the main content from a webpage.
     
@@ -231,4 +581,44 @@ def fetch_webpage(url: str) -> str:
         JSON string with extracted content including success status, URL, title, content,
         author, and published_date
     """
-    return _fetch_webpage_impl(url)
+    # Run the blocking HTTP call off the event loop so the SDK can execute
+    # several tool calls from the same turn concurrently.
+    return await asyncio.to_thread(_fetch_webpage_impl, url)
+
+
+async def _fetch_webpages_impl(urls: List[str]) -> str:
+    """
+    Fetch several webpages concurrently.
+    
+    Args:
+        urls: URLs of the webpages to fetch
+        
+    Returns:
+        JSON array with one fetch_webpage result per distinct URL, in order
+    """
+    # Each fetch blocks in its own worker thread; the pooled session lets
+    # them share connections while their network waits overlap
+    pages = await asyncio.gather(*(
+        asyncio.to_thread(_fetch_webpage_impl, url)
+        for url in dict.fromkeys(urls)
+    ))
+    return "[" + ",".join(pages) + "]"
+
+
+@function_tool
+async def fetch_webpages(urls: List[str]) -> str:
+    """
+    Fetch and extract the main content from several webpages at once.
+    
+    Prefer this over repeated fetch_webpage calls when reading multiple sources:
+    all pages are downloaded concurrently.
+    
+    Args:
+        urls: The URLs of the webpages to fetch
+        
+    Returns:
+        JSON array with one result per distinct URL, in first-seen order (duplicates are
+        fetched once), each including success status, URL, title, content, author, and
+        published_date
+    """
+    return await _fetch_webpages_impl(urls)
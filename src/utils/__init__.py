@@ -2,6 +2,17 @@
 
 from .config import Config, get_config
 from .citation import CitationManager, Citation
+from .cache import ResultCache, get_cache
+from .semantic_cache import SemanticCache, get_semantic_cache
 
-__all__ = ["Config", "get_config", "CitationManager", "Citation"]
+__all__ = [
+    "Config",
+    "get_config",
+    "CitationManager",
+    "Citation",
+    "ResultCache",
+    "get_cache",
+    "SemanticCache",
+    "get_semantic_cache",
+]
 
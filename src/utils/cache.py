@@ -0,0 +1,171 @@
+"""Persistent on-disk cache for tool results."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Evict least-recently-used entries once the stored values exceed this size
+MAX_CACHE_SIZE = 1024 ** 3  # 1 GiB
+
+
+class ResultCache:
+    """SQLite-backed key/value cache with per-entry expiry and LRU eviction."""
+    
+    def __init__(self, directory: str, ttl: int, max_size: int = MAX_CACHE_SIZE):
+        """
+        Open (or create) a cache in the given directory.
+        
+        Args:
+            directory: Directory holding the cache database
+            ttl: Time-to-live for new entries, in seconds
+            max_size: Maximum total size of cached values, in bytes
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self.max_size = max_size
+        # Tools run in worker threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "cache.sqlite3"),
+            check_same_thread=False,
+        )
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+        # Running total of stored value sizes, so writes need not re-sum the table
+        (self._size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+    
+    @staticmethod
+    def _make_key(namespace: str, key: str) -> str:
+        """Hash a namespaced key into a fixed-size database key."""
+        return hashlib.blake2b(f"{namespace}\0{key}".encode(), digest_size=16).hexdigest()
+    
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+        
+        Args:
+            namespace: Logical cache section (e.g. the tool name)
+            key: Key within the namespace
+        
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        db_key = self._make_key(namespace, key)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, size, expires_at FROM cache WHERE key = ?", (db_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, size, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (db_key,))
+                self._size -= size
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, db_key)
+            )
+            return value
+    
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        Store a value, evicting old entries if the cache grows too large.
+        
+        Args:
+            namespace: Logical cache section (e.g. the tool name)
+            key: Key within the namespace
+            value: Value to cache
+            ttl: Time-to-live for this entry, in seconds (defaults to the cache's TTL)
+        """
+        db_key = self._make_key(namespace, key)
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock, self._conn:
+            self._delete(db_key)  # a replaced value no longer counts
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (db_key, value, len(value), expires_at, now),
+            )
+            self._size += len(value)
+            if self._size > self.max_size:
+                self._evict(now)
+    
+    def delete(self, namespace: str, key: str) -> None:
+        """
+        Remove a cached value, if present.
+        
+        Args:
+            namespace: Logical cache section (e.g. the tool name)
+            key: Key within the namespace
+        """
+        db_key = self._make_key(namespace, key)
+        with self._lock, self._conn:
+            self._delete(db_key)
+    
+    def _delete(self, db_key: str) -> None:
+        """Delete an entry by database key, keeping the running size in step."""
+        row = self._conn.execute("SELECT size FROM cache WHERE key = ?", (db_key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (db_key,))
+            self._size -= row[0]
+    
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least-recently-used ones until under max_size."""
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+        # Only runs once the cache is full; re-sum to drop the expired sizes
+        (self._size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+        if self._size <= self.max_size:
+            return
+        
+        rows = self._conn.execute(
+            "SELECT key, size FROM cache ORDER BY accessed_at"
+        ).fetchall()
+        stale = []
+        for db_key, size in rows:
+            if self._size <= self.max_size:
+                break
+            stale.append((db_key,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", stale)
+        logger.info(f"Evicted {len(stale)} cache entries")
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+            self._size = 0
+
+
+@lru_cache(maxsize=None)
+def _open_cache(directory: str, ttl: int) -> ResultCache:
+    """Open one shared cache per directory/TTL."""
+    return ResultCache(directory, ttl)
+
+
+def get_cache(config: Config) -> Optional[ResultCache]:
+    """Get the shared result cache, or None if caching is disabled."""
+    if not config.cache_enabled:
+        return None
+    return _open_cache(os.path.expanduser(config.cache_dir), config.cache_ttl)
@@ -1,17 +1,19 @@
 """Citation management for tracking and formatting sources."""
 
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, HttpUrl, Field
 
 
-class Citation(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Citation:
     """A citation for a research source."""
     
     url: str
     title: str
     snippet: Optional[str] = None
-    accessed_date: datetime = Field(default_factory=datetime.now)
+    accessed_date: datetime = field(default_factory=datetime.now)
     author: Optional[str] = None
     published_date: Optional[str] = None
     
@@ -43,6 +45,12 @@ class CitationManager:
         """Initialize the citation manager."""
         self.citations: List[Citation] = []
         self._url_to_index: dict[str, int] = {}
+        # Bibliography lines, formatted once when each citation is added
+        self._formatted: List[str] = []
+        # Formatted bibliography, reset whenever the citations change
+        self._bibliography: Optional[str] = None
+        # Tools may run concurrently in worker threads
+        self._lock = threading.Lock()
     
     def add_citation(self, citation: Citation) -> int:
         """
@@ -54,15 +62,18 @@ class CitationManager:
         Returns:
             Index of the citation (1-based)
         """
-        # Check if citation already exists
-        if citation.url in self._url_to_index:
-            return self._url_to_index[citation.url]
-        
-        # Add new citation
-        self.citations.append(citation)
-        index = len(self.citations)
-        self._url_to_index[citation.url] = index
-        return index
+        with self._lock:
+            # Check if citation already exists
+            if citation.url in self._url_to_index:
+                return self._url_to_index[citation.url]
+            
+            # Add new citation
+            self.citations.append(citation)
+            index = len(self.citations)
+            self._url_to_index[citation.url] = index
+            self._formatted.append(citation.format_citation(index))
+            self._bibliography = None
+            return index
     
     def get_citation(self, index: int) -> Optional[Citation]:
         """
@@ -85,19 +96,22 @@ class CitationManager:
         Returns:
             Formatted bibliography string
         """
+        if self._bibliography is not None:
+            return self._bibliography
+        
         if not self.citations:
             return ""
         
-        lines = ["## Sources\n"]
-        for i, citation in enumerate(self.citations, 1):
-            lines.append(citation.format_citation(i))
-        
-        return "\n".join(lines)
+        self._bibliography = "\n".join(["## Sources\n", *self._formatted])
+        return self._bibliography
     
     def clear(self) -> None:
         """Clear all citations."""
-        self.citations = []
-        self._url_to_index = {}
+        with self._lock:
+            self.citations = []
+            self._url_to_index = {}
+            self._formatted = []
+            self._bibliography = None
     
     def count(self) -> int:
         """
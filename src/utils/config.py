@@ -1,6 +1,7 @@
 """Configuration management for the research assistant."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
@@ -20,9 +21,31 @@ class Config(BaseModel):
     agent_model: str = Field(default_factory=lambda: os.getenv("AGENT_MODEL", "gpt-4-turbo"))
     agent_temperature: float = Field(default_factory=lambda: float(os.getenv("AGENT_TEMPERATURE", "0.3")))
     
+    # OpenAI endpoint (e.g. a batch-API proxy); empty uses the default API
+    openai_base_url: str = Field(default_factory=lambda: os.getenv("OPENAI_BASE_URL", ""))
+    openai_timeout: float = Field(default_factory=lambda: float(os.getenv("OPENAI_TIMEOUT", "600")))
+    
     # Search settings
     max_search_results: int = Field(default_factory=lambda: int(os.getenv("MAX_SEARCH_RESULTS", "5")))
     request_timeout: int = Field(default_factory=lambda: int(os.getenv("REQUEST_TIMEOUT", "30")))
+    # Process-wide: also applies to the OpenAI and Tavily clients
+    dns_cache_enabled: bool = Field(
+        default_factory=lambda: os.getenv("DNS_CACHE_ENABLED", "false").lower() == "true"
+    )
+    
+    # Persistent cache for search results and fetched pages
+    cache_enabled: bool = Field(default_factory=lambda: os.getenv("CACHE_ENABLED", "true").lower() == "true")
+    cache_dir: str = Field(default_factory=lambda: os.getenv("CACHE_DIR", "~/.cache/research_assistant"))
+    cache_ttl: int = Field(default_factory=lambda: int(os.getenv("CACHE_TTL", "86400")))
+    
+    # Semantic cache: reuse results of earlier research on similar queries
+    semantic_cache_enabled: bool = Field(
+        default_factory=lambda: os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    )
+    semantic_cache_threshold: float = Field(
+        default_factory=lambda: float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.90"))
+    )
+    embedding_model: str = Field(default_factory=lambda: os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"))
     
     # User agent for web requests
     user_agent: str = "Mozilla/5.0 (compatible; ResearchAssistant/1.0)"
@@ -39,8 +62,9 @@ class Config(BaseModel):
         frozen = True
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get application configuration."""
+    """Get application configuration (read from the environment once per process)."""
     config = Config()
     config.validate_required_keys()
     return config
@@ -0,0 +1,183 @@
+"""Semantic cache returning stored research results for similar queries."""
+
+import logging
+import math
+import operator
+import os
+import sqlite3
+import threading
+from array import array
+from collections import deque
+from typing import Callable, Deque, List, Optional
+from openai import OpenAI
+
+from ..models.data_models import ResearchResult
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], List[float]]
+
+# Lookups compare the query with every stored embedding in pure Python
+# (O(entries x dimensions), ~65 ms at 1536 dimensions), so only the most
+# recently stored results are kept
+MAX_SEMANTIC_CACHE_ENTRIES = 1000
+
+
+def _normalize(vector: List[float]) -> array:
+    """Scale a vector to unit length so a dot product is cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return array("f", (x / norm for x in vector))
+
+
+class SemanticCache:
+    """Cache of research results looked up by query-embedding similarity."""
+    
+    def __init__(
+        self,
+        directory: str,
+        threshold: float,
+        embed: Embedder,
+        max_entries: int = MAX_SEMANTIC_CACHE_ENTRIES,
+    ):
+        """
+        Open (or create) a semantic cache in the given directory.
+        
+        Args:
+            directory: Directory holding the cache database
+            threshold: Minimum cosine similarity for a cache hit
+            embed: Function returning the embedding vector for a query
+            max_entries: Maximum number of stored results (oldest are dropped first)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embed = embed
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "semantic_cache.sqlite3"),
+            check_same_thread=False,
+        )
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS results (
+                    research_depth TEXT NOT NULL,
+                    max_sources INTEGER NOT NULL,
+                    embedding BLOB NOT NULL,
+                    result TEXT NOT NULL
+                )"""
+            )
+            # Drop results beyond the limit (e.g. stored under a larger one)
+            self._conn.execute(
+                "DELETE FROM results WHERE rowid NOT IN "
+                "(SELECT rowid FROM results ORDER BY rowid DESC LIMIT ?)",
+                (max_entries,),
+            )
+        
+        # Keep embeddings in memory, oldest first; results are loaded only on a hit
+        self._entries: Deque[tuple] = deque()
+        for rowid, depth, max_sources, blob in self._conn.execute(
+            "SELECT rowid, research_depth, max_sources, embedding FROM results ORDER BY rowid"
+        ):
+            embedding = array("f")
+            embedding.frombytes(blob)
+            self._entries.append((depth, max_sources, embedding, rowid))
+    
+    def embed(self, query: str) -> Optional[array]:
+        """
+        Embed a query for lookup/storage.
+        
+        Args:
+            query: Research query
+        
+        Returns:
+            Normalized embedding, or None if the embedding call failed
+        """
+        try:
+            return _normalize(self._embed(query))
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {str(e)}")
+            return None
+    
+    def lookup(
+        self,
+        embedding: array,
+        research_depth: str,
+        max_sources: int,
+    ) -> Optional[ResearchResult]:
+        """
+        Find a stored result for a similar query with the same settings.
+        
+        Args:
+            embedding: Normalized query embedding (see embed())
+            research_depth: Research depth of the query
+            max_sources: Maximum number of sources of the query
+        
+        Returns:
+            The most similar stored result above the threshold, or None
+        """
+        best_score, best_rowid = self.threshold, None
+        for depth, sources, stored, rowid in self._entries:
+            if depth != research_depth or sources != max_sources:
+                continue
+            score = sum(map(operator.mul, embedding, stored))
+            if score >= best_score:
+                best_score, best_rowid = score, rowid
+        
+        if best_rowid is None:
+            return None
+        
+        with self._lock:
+            (result_json,) = self._conn.execute(
+                "SELECT result FROM results WHERE rowid = ?", (best_rowid,)
+            ).fetchone()
+        logger.info(f"Semantic cache hit (similarity {best_score:.3f})")
+        return ResearchResult.model_validate_json(result_json)
+    
+    def store(
+        self,
+        embedding: array,
+        research_depth: str,
+        max_sources: int,
+        result: ResearchResult,
+    ) -> None:
+        """
+        Store a research result under its query embedding, dropping the oldest if full.
+        
+        Args:
+            embedding: Normalized query embedding (see embed())
+            research_depth: Research depth of the query
+            max_sources: Maximum number of sources of the query
+            result: Research result to store
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?)",
+                (research_depth, max_sources, embedding.tobytes(), result.model_dump_json()),
+            )
+            self._entries.append((research_depth, max_sources, embedding, cursor.lastrowid))
+            while len(self._entries) > self.max_entries:
+                oldest_rowid = self._entries.popleft()[3]
+                self._conn.execute("DELETE FROM results WHERE rowid = ?", (oldest_rowid,))
+
+
+def get_semantic_cache(config: Config) -> Optional[SemanticCache]:
+    """Create the semantic cache, or return None if it is disabled."""
+    if not config.semantic_cache_enabled:
+        return None
+    
+    client = OpenAI(
+        api_key=config.openai_api_key,
+        base_url=config.openai_base_url or None,
+        timeout=config.openai_timeout,
+    )
+    
+    def embed(query: str) -> List[float]:
+        response = client.embeddings.create(model=config.embedding_model, input=query)
+        return response.data[0].embedding
+    
+    return SemanticCache(
+        os.path.expanduser(config.cache_dir),
+        config.semantic_cache_threshold,
+        embed,
+    )
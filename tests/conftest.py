@@ -1,17 +1,54 @@
 """Pytest fixtures and configuration for tests."""
 
-import os
+import importlib
 from datetime import datetime
+from functools import partialmethod
 from unittest.mock import MagicMock, Mock, patch
 import pytest
+import responses
+from tavily import TavilyClient
 
-from src.utils.config import Config
+from src.agent import ResearchAgent
+from src.utils.citation import Citation
+from src.utils.config import Config, get_config
+import src.tools.webpage_fetcher as webpage_fetcher_module
 from src.models.data_models import SearchResult, WebpageContent
 
+web_search_module = importlib.import_module("src.tools.web_search")
 
-@pytest.fixture
+
+SAMPLE_ARTICLE_HTML = b"""
+    <html>
+    <head><title>Introduction to Vector Databases</title>
+    <meta name="author" content="Jane Doe">
+    <meta name="date" content="2024-01-15">
+    </head>
+    <body>
+        <article>
+            <h1>Introduction to Vector Databases</h1>
+            <p>This is a comprehensive guide to vector databases...</p>
+        </article>
+    </body>
+    </html>
+    """
+
+
+# Accessed date given to every citation created without an explicit one
+FROZEN_ACCESSED_DATE = datetime(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def frozen_accessed_date():
+    """Default ``Citation.accessed_date`` to a fixed date: no clock reads, stable output."""
+    with patch.object(
+        Citation, "__init__", partialmethod(Citation.__init__, accessed_date=FROZEN_ACCESSED_DATE)
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
 def mock_config():
-    """Create a mock configuration for testing."""
+    """Create a mock configuration for testing (frozen, so shared by all tests)."""
     return Config(
         openai_api_key="test-openai-key",
         tavily_api_key="test-tavily-key",
@@ -19,12 +56,34 @@ def mock_config():
         agent_temperature=0.3,
         max_search_results=5,
         request_timeout=30,
+        cache_enabled=False,
     )
 
 
+@pytest.fixture(scope="session")
+def agent(mock_config):
+    """One agent per session (per worker under pytest-xdist); research() resets per-run state."""
+    return ResearchAgent(mock_config, tavily_client=MagicMock(spec=TavilyClient))
+
+
+# Module globals rebound by ResearchAgent() and the tools' init/set functions
+_TOOL_GLOBALS = (
+    (web_search_module, ("_config", "_tavily_client", "_cache")),
+    (webpage_fetcher_module, ("_config", "_session", "_citation_manager", "_cache")),
+)
+
+
 @pytest.fixture
+def restore_tool_globals(monkeypatch):
+    """Restore the tool globals afterwards, so the shared agent keeps its own."""
+    for module, names in _TOOL_GLOBALS:
+        for name in names:
+            monkeypatch.setattr(module, name, getattr(module, name))
+
+
+@pytest.fixture(scope="session")
 def sample_search_results():
-    """Sample search results for testing."""
+    """Sample search results for testing (frozen models, shared by all tests)."""
     return [
         SearchResult(
             url="https://example.com/article1",
@@ -60,11 +119,10 @@ def sample_webpage_content():
     )
 
 
-@pytest.fixture
-def mock_tavily_client(sample_search_results):
-    """Mock Tavily client for testing."""
-    mock_client = MagicMock()
-    mock_client.search.return_value = {
+@pytest.fixture(scope="session")
+def tavily_search_response(sample_search_results):
+    """Raw Tavily search payload for the sample results, built once per session."""
+    return {
         "results": [
             {
                 "url": r.url,
@@ -75,6 +133,13 @@ def mock_tavily_client(sample_search_results):
             for r in sample_search_results
         ]
     }
+
+
+@pytest.fixture
+def mock_tavily_client(tavily_search_response):
+    """Mock Tavily client for testing."""
+    mock_client = MagicMock()
+    mock_client.search.return_value = tavily_search_response
     return mock_client
 
 
@@ -91,36 +156,44 @@ def mock_runner():
         yield mock
 
 
+@pytest.fixture(scope="session")
+def fetcher_session(mock_config):
+    """One real fetcher session for the test session; no test mutates it."""
+    return webpage_fetcher_module._create_session(mock_config)
+
+
 @pytest.fixture
-def mock_requests_get(sample_webpage_content):
-    """Mock requests.get for webpage fetching."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.content = b"""
-    <html>
-    <head><title>Introduction to Vector Databases</title>
-    <meta name="author" content="Jane Doe">
-    <meta name="date" content="2024-01-15">
-    </head>
-    <body>
-        <article>
-            <h1>Introduction to Vector Databases</h1>
-            <p>This is a comprehensive guide to vector databases...</p>
-        </article>
-    </body>
-    </html>
-    """
-    return mock_response
+def mocked_webpage(mock_config, fetcher_session):
+    """Serve canned pages to a real fetcher session through `responses`."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.get(
+            "https://example.com",
+            body="<html><head><title>Test</title></head><body><p>Content</p></body></html>",
+            content_type="text/html",
+        )
+        rsps.get(
+            "https://example.com/article1",
+            body=SAMPLE_ARTICLE_HTML,
+            content_type="text/html",
+        )
+        with patch.object(webpage_fetcher_module, "_config", mock_config), \
+                patch.object(webpage_fetcher_module, "_session", fetcher_session):
+            yield rsps
+
+
+@pytest.fixture(autouse=True)
+def set_test_env_vars(monkeypatch):
+    """Set test environment variables; monkeypatch restores them afterwards."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setenv("TAVILY_API_KEY", "test-tavily-key")
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
 
 
 @pytest.fixture(autouse=True)
-def set_test_env_vars():
-    """Set test environment variables."""
-    os.environ["OPENAI_API_KEY"] = "test-openai-key"
-    os.environ["TAVILY_API_KEY"] = "test-tavily-key"
+def clear_revalidation_cache():
+    """Start every test without remembered page validators."""
+    webpage_fetcher_module._revalidation.clear()
     yield
-    # Cleanup
-    if "OPENAI_API_KEY" in os.environ:
-        del os.environ["OPENAI_API_KEY"]
-    if "TAVILY_API_KEY" in os.environ:
-        del os.environ["TAVILY_API_KEY"]
+    webpage_fetcher_module._revalidation.clear()
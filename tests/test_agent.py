@@ -1,115 +1,170 @@
 """Tests for the research agent."""
 
+import copy
+import importlib
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import pytest
+from tavily import TavilyClient
 
 from src.agent import ResearchAgent
-from src.models.data_models import ResearchDepth
+from src.models.data_models import ResearchDepth, ResearchQuery
+from src.utils.citation import Citation
+
+web_search_module = importlib.import_module("src.tools.web_search")
+
+
+# Canonical Runner result; tests take a shallow copy instead of building a mock
+_RUNNER_RESULT = SimpleNamespace(final_output="Summary")
+
+
+def _runner_result(final_output: str = "Summary") -> SimpleNamespace:
+    """Return a fresh copy of the canonical Runner result."""
+    result = copy.copy(_RUNNER_RESULT)
+    result.final_output = final_output
+    return result
+
+
+@pytest.fixture(scope="class")
+def runner_patch():
+    """Patch the SDK Runner once for the whole test class."""
+    with patch('src.agent.Runner') as runner:
+        yield runner
+
+
+@pytest.fixture
+def mock_runner_class(runner_patch):
+    """Reset the shared Runner mock and return a canonical result by default."""
+    runner_patch.reset_mock(return_value=True, side_effect=True)
+    runner_patch.run_sync.return_value = _runner_result()
+    return runner_patch
 
 
 class TestResearchAgent:
     """Test ResearchAgent class."""
     
-    def test_agent_initialization(self, mock_config):
+    def test_agent_initialization(self, agent, mock_config):
         """Test agent initialization."""
-        agent = ResearchAgent(mock_config)
-        
         assert agent.config == mock_config
         assert agent.citation_manager is not None
     
-    @patch('src.agent.Runner')
-    def test_research_simple_flow(self, mock_runner_class, mock_config):
-        """Test simple research flow."""
-        # Setup Runner mock
-        mock_result = MagicMock()
-        mock_result.final_output = "Research summary goes here"
-        mock_runner_class.run_sync.return_value = mock_result
-        
-        # Create agent and run research
-        agent = ResearchAgent(mock_config)
-        result = agent.research(query="test query")
+    @pytest.mark.parametrize("depth", [
+        ResearchDepth.QUICK,
+        ResearchDepth.STANDARD,
+        ResearchDepth.COMPREHENSIVE,
+    ])
+    def test_research_depth(self, mock_runner_class, agent, depth):
+        """Test the research flow at each depth."""
+        mock_runner_class.run_sync.return_value = _runner_result("Research summary goes here")
+        
+        result = agent.research(query="test query", research_depth=depth)
         
         assert result.query == "test query"
         assert "Research summary goes here" in result.summary
-        assert result.research_depth == ResearchDepth.STANDARD
+        assert result.research_depth == depth
         
         # Verify Runner was called
         mock_runner_class.run_sync.assert_called_once()
     
-    @patch('src.agent.Runner')
-    def test_research_error_handling(self, mock_runner_class, mock_config):
+    def test_research_error_handling(self, mock_runner_class, agent):
         """Test research error handling."""
         # Setup Runner to raise error
         mock_runner_class.run_sync.side_effect = Exception("Test error")
         
-        agent = ResearchAgent(mock_config)
         result = agent.research(query="test query")
         
         assert result.query == "test query"
         assert "failed" in result.summary.lower()
     
-    @patch('src.agent.Runner')
-    def test_research_quick_depth(self, mock_runner_class, mock_config):
-        """Test research with quick depth."""
-        mock_result = MagicMock()
-        mock_result.final_output = "Quick summary"
-        mock_runner_class.run_sync.return_value = mock_result
-        
-        agent = ResearchAgent(mock_config)
-        result = agent.research(query="test", research_depth=ResearchDepth.QUICK)
-        
-        assert result.research_depth == ResearchDepth.QUICK
+    def test_research_streaming(self, mock_runner_class, agent):
+        """Test that streamed text is reported to the callback."""
+        def raw(data_type, delta=None):
+            return SimpleNamespace(
+                type="raw_response_event",
+                data=SimpleNamespace(type=data_type, delta=delta),
+            )
+        
+        events = [
+            raw("response.created"),
+            raw("response.output_text.delta", "Let me search"),
+            SimpleNamespace(type="run_item_stream_event"),
+            raw("response.created"),
+            raw("response.output_text.delta", "Streamed "),
+            raw("response.output_text.delta", "summary"),
+        ]
+        
+        async def stream_events():
+            for event in events:
+                yield event
+        
+        mock_result = _runner_result("Streamed summary")
+        mock_result.stream_events = stream_events
+        mock_runner_class.run_streamed.return_value = mock_result
+        
+        updates = []
+        result = agent.research(query="test", on_text=updates.append)
+        
+        assert updates == ["Let me search", "Streamed ", "Streamed summary"]
+        assert "Streamed summary" in result.summary
+        mock_runner_class.run_sync.assert_not_called()
+        assert mock_runner_class.run_streamed.call_args[1].get("max_turns") == 10
     
-    @patch('src.agent.Runner')
-    def test_research_comprehensive_depth(self, mock_runner_class, mock_config):
-        """Test research with comprehensive depth."""
-        mock_result = MagicMock()
-        mock_result.final_output = "Comprehensive summary"
-        mock_runner_class.run_sync.return_value = mock_result
-        
-        agent = ResearchAgent(mock_config)
-        result = agent.research(query="test", research_depth=ResearchDepth.COMPREHENSIVE)
-        
-        assert result.research_depth == ResearchDepth.COMPREHENSIVE
+    def test_research_empty_query(self, mock_runner_class, agent):
+        """Test that blank queries return without calling the model."""
+        for result in (
+            agent.research(query=""),
+            agent.research(query="   "),
+            agent.research(query="test", max_sources=0),
+        ):
+            assert result.summary == ""
+            assert result.sources_consulted == []
+        
+        mock_runner_class.run_sync.assert_not_called()
     
-    @patch('src.agent.Runner')
-    def test_research_max_turns(self, mock_runner_class, mock_config):
+    def test_research_max_turns(self, mock_runner_class, agent):
         """Test that research uses max_turns limit."""
-        mock_result = MagicMock()
-        mock_result.final_output = "Summary"
-        mock_runner_class.run_sync.return_value = mock_result
-        
-        agent = ResearchAgent(mock_config)
         agent.research(query="test")
         
         # Verify max_turns was set
         call_kwargs = mock_runner_class.run_sync.call_args[1]
         assert call_kwargs.get("max_turns") == 10
     
-    @patch('src.agent.Runner')
-    def test_citation_manager_uses_global_state(self, mock_runner_class, mock_config):
-        """Test that citation manager is available."""
-        mock_result = MagicMock()
-        mock_result.final_output = "Summary"
-        mock_runner_class.run_sync.return_value = mock_result
+    def test_research_custom_base_url(self, mock_runner_class, mock_config, restore_tool_globals):
+        """Test that a configured base URL routes model calls through it."""
+        config = mock_config.model_copy(update={
+            "openai_base_url": "http://127.0.0.1:3030/v1",
+            "openai_timeout": 3600,
+        })
+        
+        agent = ResearchAgent(config)
+        agent.research(query="test")
         
-        agent = ResearchAgent(mock_config)
+        run_config = mock_runner_class.run_sync.call_args[1]["run_config"]
+        client = run_config.model_provider._client
+        assert str(client.base_url) == "http://127.0.0.1:3030/v1/"
+        assert client.timeout == 3600
+    
+    def test_injected_tavily_client(self, mock_config, restore_tool_globals):
+        """Test that an injected Tavily client is used by the web search tool."""
+        client = MagicMock(spec=TavilyClient)
+        
+        ResearchAgent(mock_config, tavily_client=client)
         
-        # Citation manager should be set
-        from src.tools.webpage_fetcher import _citation_manager
+        assert web_search_module._tavily_client is client
+    
+    def test_default_endpoint(self, agent):
+        """Test that no run config is used without a base URL."""
+        assert agent.run_config is None
+    
+    def test_citation_manager_uses_global_state(self, mock_runner_class, agent):
+        """Test that citation manager is available."""
         # After init, citation manager should be set
         agent.research(query="test")
         # We can't easily test the global state, but we can verify it exists
         assert agent.citation_manager is not None
     
-    @patch('src.agent.Runner')
-    def test_create_agent_with_tools(self, mock_runner_class, mock_config):
+    def test_create_agent_with_tools(self, mock_runner_class, agent):
         """Test that agent is created with correct tools."""
-        mock_result = MagicMock()
-        mock_result.final_output = "Summary"
-        mock_runner_class.run_sync.return_value = mock_result
-        
-        agent = ResearchAgent(mock_config)
         agent.research(query="test query")
         
         # Get the agent that was passed to Runner
@@ -120,37 +175,48 @@ class TestResearchAgent:
         assert hasattr(agent_arg, 'name')
         assert agent_arg.name == "Research Assistant"
         assert hasattr(agent_arg, 'tools')
-        assert len(agent_arg.tools) == 2
+        assert len(agent_arg.tools) == 4
+        assert agent_arg.model_settings.parallel_tool_calls is True
+        assert agent_arg.instructions == ResearchAgent.SYSTEM_PROMPT
     
-    def test_research_instructions_content(self, mock_config):
-        """Test the content of research instructions."""
-        from src.models.data_models import ResearchQuery
-        
-        agent = ResearchAgent(mock_config)
+    def test_agent_reused_across_research_calls(self, mock_runner_class, agent):
+        """Test that one Agent serves every research call."""
+        agent.research(query="first topic", research_depth=ResearchDepth.QUICK)
+        agent.research(query="second topic", max_sources=3)
+        
+        first_call, second_call = mock_runner_class.run_sync.call_args_list
+        assert first_call[0][0] is agent.agent
+        assert second_call[0][0] is agent.agent
+        assert "first topic" in first_call[1]["input"]
+        assert "quick" in first_call[1]["input"]
+        assert "second topic" in second_call[1]["input"]
+        assert "up to 3 sources" in second_call[1]["input"]
+    
+    @pytest.mark.parametrize("depth, must_contain", [
+        (ResearchDepth.QUICK, ["quick", "brief"]),
+        (ResearchDepth.STANDARD, ["standard", "multiple sources"]),
+        (ResearchDepth.COMPREHENSIVE, ["comprehensive", "in-depth"]),
+    ])
+    def test_research_prompt_content(self, agent, depth, must_contain):
+        """Test the content of the research prompt at each depth."""
         query = ResearchQuery(
             query="test topic",
-            research_depth=ResearchDepth.STANDARD,
+            research_depth=depth,
             max_sources=5,
         )
         
-        instructions = agent._create_research_instructions(query)
+        prompt = agent._create_research_prompt(query)
         
-        assert "standard" in instructions.lower()
-        assert "web_search" in instructions
-        assert "fetch_webpage" in instructions
-        assert "5" in instructions  # max_sources
+        assert "test topic" in prompt
+        for token in must_contain:
+            assert token in prompt.lower()
+        assert "web_search" in prompt
+        assert "fetch_webpage" in prompt
+        assert "5" in prompt  # max_sources
     
-    @patch('src.agent.Runner')
-    def test_sources_consulted_extraction(self, mock_runner_class, mock_config):
+    def test_sources_consulted_extraction(self, mock_runner_class, agent):
         """Test that sources consulted are extracted from citations."""
-        mock_result = MagicMock()
-        mock_result.final_output = "Summary"
-        mock_runner_class.run_sync.return_value = mock_result
-        
-        agent = ResearchAgent(mock_config)
-        
         # Manually add a citation to test extraction
-        from src.utils.citation import Citation
         agent.citation_manager.add_citation(
             Citation(url="https://test.com", title="Test")
         )
@@ -0,0 +1,157 @@
+"""Tests for the persistent result cache."""
+
+import importlib
+import json
+from unittest.mock import MagicMock, patch
+import pytest
+
+from src.utils.cache import ResultCache, get_cache
+from src.utils.citation import CitationManager
+from src.tools.web_search import _web_search_impl
+from src.tools.webpage_fetcher import _fetch_webpage_impl
+import src.tools.webpage_fetcher as webpage_fetcher_module
+
+# The package re-exports the `web_search` tool under the submodule's name
+web_search_module = importlib.import_module("src.tools.web_search")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return ResultCache(str(tmp_path), ttl=60)
+
+
+class TestResultCache:
+    """Test ResultCache class."""
+    
+    def test_get_missing(self, cache):
+        """Test that a missing key returns None."""
+        assert cache.get("ns", "missing") is None
+    
+    def test_set_and_get(self, cache):
+        """Test storing and retrieving a value."""
+        cache.set("ns", "key", "value")
+        
+        assert cache.get("ns", "key") == "value"
+        assert cache.get("other", "key") is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test that values survive reopening the cache."""
+        ResultCache(str(tmp_path), ttl=60).set("ns", "key", "value")
+        
+        assert ResultCache(str(tmp_path), ttl=60).get("ns", "key") == "value"
+    
+    def test_expired_entry(self, tmp_path):
+        """Test that expired entries are not returned."""
+        cache = ResultCache(str(tmp_path), ttl=0)
+        cache.set("ns", "key", "value")
+        
+        assert cache.get("ns", "key") is None
+    
+    def test_entry_ttl_override(self, tmp_path):
+        """Test that an entry can outlive the cache's default TTL."""
+        cache = ResultCache(str(tmp_path), ttl=0)
+        cache.set("ns", "short", "value")
+        cache.set("ns", "long", "value", ttl=60)
+        
+        assert cache.get("ns", "short") is None
+        assert cache.get("ns", "long") == "value"
+    
+    def test_delete(self, cache):
+        """Test removing a single entry."""
+        cache.set("ns", "a", "1")
+        cache.set("ns", "b", "2")
+        
+        cache.delete("ns", "a")
+        cache.delete("ns", "missing")
+        
+        assert cache.get("ns", "a") is None
+        assert cache.get("ns", "b") == "2"
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test LRU eviction once max_size is exceeded."""
+        cache = ResultCache(str(tmp_path), ttl=60, max_size=10)
+        cache.set("ns", "a", "aaaa")
+        cache.set("ns", "b", "bbbb")
+        cache.get("ns", "a")  # "b" is now least recently used
+        cache.set("ns", "c", "cccc")
+        
+        assert cache.get("ns", "a") == "aaaa"
+        assert cache.get("ns", "b") is None
+        assert cache.get("ns", "c") == "cccc"
+    
+    def test_tracks_size_across_replace_and_delete(self, tmp_path):
+        """Test that replaced and deleted values stop counting towards max_size."""
+        cache = ResultCache(str(tmp_path), ttl=60, max_size=10)
+        cache.set("ns", "a", "aaaa")
+        cache.set("ns", "b", "bbbb")
+        cache.set("ns", "b", "bbbbb")
+        cache.delete("ns", "b")
+        cache.set("ns", "c", "cccc")
+        
+        assert cache.get("ns", "a") == "aaaa"
+        assert cache.get("ns", "c") == "cccc"
+        assert ResultCache(str(tmp_path), ttl=60)._size == 8
+    
+    def test_clear(self, cache):
+        """Test clearing the cache."""
+        cache.set("ns", "key", "value")
+        cache.clear()
+        
+        assert cache.get("ns", "key") is None
+    
+    def test_get_cache_disabled(self, mock_config):
+        """Test that get_cache returns None when caching is disabled."""
+        assert get_cache(mock_config) is None
+    
+    def test_get_cache_shared(self, mock_config, tmp_path):
+        """Test that get_cache returns one shared instance per directory."""
+        config = mock_config.model_copy(update={"cache_enabled": True, "cache_dir": str(tmp_path)})
+        
+        assert isinstance(get_cache(config), ResultCache)
+        assert get_cache(config) is get_cache(config)
+
+
+class TestToolCaching:
+    """Test caching in the tool implementations."""
+    
+    def test_web_search_cache_hit(self, cache, mock_config, mock_tavily_client):
+        """Test that a repeated search is served from the cache."""
+        with patch.object(web_search_module, "_cache", cache), \
+                patch.object(web_search_module, "_config", mock_config), \
+                patch.object(web_search_module, "_tavily_client", mock_tavily_client):
+            first = _web_search_impl(query="vector databases")
+            second = _web_search_impl(query="vector databases")
+        
+        assert first == second
+        assert json.loads(first)["count"] == 3
+        mock_tavily_client.search.assert_called_once()
+    
+    def test_web_search_errors_not_cached(self, cache, mock_config):
+        """Test that failed searches are not cached."""
+        client = MagicMock()
+        client.search.side_effect = Exception("API error")
+        
+        with patch.object(web_search_module, "_cache", cache), \
+                patch.object(web_search_module, "_config", mock_config), \
+                patch.object(web_search_module, "_tavily_client", client):
+            _web_search_impl(query="test")
+            _web_search_impl(query="test")
+        
+        assert client.search.call_count == 2
+    
+    def test_fetch_webpage_cache_hit(self, cache, mocked_webpage):
+        """Test that a cached page skips the network but is still cited."""
+        citation_manager = CitationManager()
+        
+        with patch.object(webpage_fetcher_module, "_cache", cache), \
+                patch.object(webpage_fetcher_module, "_citation_manager", citation_manager):
+            first = _fetch_webpage_impl(url="https://example.com/article1")
+            citation_manager.clear()
+            second = _fetch_webpage_impl(url="https://example.com/article1")
+        
+        assert first == second
+        assert json.loads(second)["title"] == "Introduction to Vector Databases"
+        assert len(mocked_webpage.calls) == 1
+        assert citation_manager.count() == 1
+        assert citation_manager.get_citation(1).author == "Jane Doe"
@@ -1,5 +1,7 @@
 """Tests for citation management."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 import pytest
 
@@ -26,6 +28,13 @@ class TestCitation:
         assert citation.published_date == "2024-01-15"
         assert isinstance(citation.accessed_date, datetime)
     
+    def test_citation_immutable(self):
+        """Test that citations cannot be modified after creation."""
+        citation = Citation(url="https://example.com/article", title="Test Article")
+        
+        with pytest.raises(FrozenInstanceError):
+            citation.title = "Changed"
+    
     def test_citation_format(self):
         """Test formatting a citation."""
         citation = Citation(
@@ -40,7 +49,7 @@ class TestCitation:
         assert "Test Article" in formatted
         assert "by John Doe" in formatted
         assert "https://example.com/article" in formatted
-        assert "Accessed:" in formatted
+        assert "(Accessed: 2024-01-01)" in formatted
     
     def test_citation_format_without_author(self):
         """Test formatting citation without author."""
@@ -57,45 +66,42 @@ class TestCitation:
         assert "https://example.com/article" in formatted
 
 
+@pytest.fixture(scope="module")
+def canonical_citations():
+    """Citations shared by the module; they are frozen, so reuse is safe."""
+    return tuple(
+        Citation(url=f"https://example.com/{i}", title=f"Article {i}")
+        for i in range(1, 6)
+    )
+
+
+@pytest.fixture
+def manager():
+    """A fresh, empty citation manager."""
+    return CitationManager()
+
+
 class TestCitationManager:
     """Test CitationManager class."""
     
-    def test_add_citation(self):
+    def test_add_citation(self, manager, canonical_citations):
         """Test adding a citation."""
-        manager = CitationManager()
-        citation = Citation(
-            url="https://example.com/article1",
-            title="Article 1",
-        )
-        
-        index = manager.add_citation(citation)
+        index = manager.add_citation(canonical_citations[0])
         
         assert index == 1
         assert manager.count() == 1
     
-    def test_add_multiple_citations(self):
+    def test_add_multiple_citations(self, manager, canonical_citations):
         """Test adding multiple citations."""
-        manager = CitationManager()
+        indices = [manager.add_citation(c) for c in canonical_citations[:3]]
         
-        citation1 = Citation(url="https://example.com/1", title="Article 1")
-        citation2 = Citation(url="https://example.com/2", title="Article 2")
-        citation3 = Citation(url="https://example.com/3", title="Article 3")
-        
-        index1 = manager.add_citation(citation1)
-        index2 = manager.add_citation(citation2)
-        index3 = manager.add_citation(citation3)
-        
-        assert index1 == 1
-        assert index2 == 2
-        assert index3 == 3
+        assert indices == [1, 2, 3]
         assert manager.count() == 3
     
-    def test_add_duplicate_citation(self):
+    def test_add_duplicate_citation(self, manager, canonical_citations):
         """Test adding a duplicate citation returns existing index."""
-        manager = CitationManager()
-        
-        citation1 = Citation(url="https://example.com/article", title="Article")
-        citation2 = Citation(url="https://example.com/article", title="Same Article")
+        citation1 = canonical_citations[0]
+        citation2 = Citation(url=citation1.url, title="Same Article")
         
         index1 = manager.add_citation(citation1)
         index2 = manager.add_citation(citation2)
@@ -103,10 +109,9 @@ class TestCitationManager:
         assert index1 == index2
         assert manager.count() == 1
     
-    def test_get_citation(self):
+    def test_get_citation(self, manager, canonical_citations):
         """Test retrieving a citation by index."""
-        manager = CitationManager()
-        citation = Citation(url="https://example.com/article", title="Article")
+        citation = canonical_citations[0]
         
         index = manager.add_citation(citation)
         retrieved = manager.get_citation(index)
@@ -115,31 +120,22 @@ class TestCitationManager:
         assert retrieved.url == citation.url
         assert retrieved.title == citation.title
     
-    def test_get_citation_invalid_index(self):
+    def test_get_citation_invalid_index(self, manager):
         """Test retrieving citation with invalid index."""
-        manager = CitationManager()
-        
         assert manager.get_citation(0) is None
         assert manager.get_citation(100) is None
         assert manager.get_citation(-1) is None
     
-    def test_format_bibliography_empty(self):
+    def test_format_bibliography_empty(self, manager):
         """Test formatting empty bibliography."""
-        manager = CitationManager()
-        
         bibliography = manager.format_bibliography()
         
         assert bibliography == ""
     
-    def test_format_bibliography(self):
+    def test_format_bibliography(self, manager, canonical_citations):
         """Test formatting bibliography with citations."""
-        manager = CitationManager()
-        
-        citation1 = Citation(url="https://example.com/1", title="Article 1")
-        citation2 = Citation(url="https://example.com/2", title="Article 2")
-        
-        manager.add_citation(citation1)
-        manager.add_citation(citation2)
+        manager.add_citation(canonical_citations[0])
+        manager.add_citation(canonical_citations[1])
         
         bibliography = manager.format_bibliography()
         
@@ -149,15 +145,26 @@ class TestCitationManager:
         assert "Article 1" in bibliography
         assert "Article 2" in bibliography
     
-    def test_clear_citations(self):
-        """Test clearing all citations."""
-        manager = CitationManager()
+    def test_format_bibliography_updates(self, manager, canonical_citations):
+        """Test that the cached bibliography tracks added and cleared citations."""
+        manager.add_citation(canonical_citations[0])
+        
+        first = manager.format_bibliography()
+        assert manager.format_bibliography() is first
+        
+        manager.add_citation(canonical_citations[0])
+        assert manager.format_bibliography() is first
         
-        citation1 = Citation(url="https://example.com/1", title="Article 1")
-        citation2 = Citation(url="https://example.com/2", title="Article 2")
+        manager.add_citation(canonical_citations[1])
+        assert "Article 2" in manager.format_bibliography()
         
-        manager.add_citation(citation1)
-        manager.add_citation(citation2)
+        manager.clear()
+        assert manager.format_bibliography() == ""
+    
+    def test_clear_citations(self, manager, canonical_citations):
+        """Test clearing all citations."""
+        manager.add_citation(canonical_citations[0])
+        manager.add_citation(canonical_citations[1])
         assert manager.count() == 2
         
         manager.clear()
@@ -165,18 +172,28 @@ class TestCitationManager:
         assert manager.count() == 0
         assert manager.format_bibliography() == ""
     
-    def test_count(self):
+    def test_count(self, manager, canonical_citations):
         """Test counting citations."""
-        manager = CitationManager()
-        
         assert manager.count() == 0
         
-        manager.add_citation(Citation(url="https://example.com/1", title="A1"))
+        manager.add_citation(canonical_citations[0])
         assert manager.count() == 1
         
-        manager.add_citation(Citation(url="https://example.com/2", title="A2"))
+        manager.add_citation(canonical_citations[1])
         assert manager.count() == 2
         
         manager.clear()
         assert manager.count() == 0
-
+    
+    def test_add_citation_concurrently(self, manager):
+        """Test that concurrent adds produce unique, contiguous indices."""
+        citations = [
+            Citation(url=f"https://example.com/{i}", title=f"Article {i}")
+            for i in range(50)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            indices = list(executor.map(manager.add_citation, citations))
+        
+        assert sorted(indices) == list(range(1, 51))
+        assert manager.count() == 50
@@ -13,6 +13,9 @@ from src.models.data_models import (
     ResearchResult,
 )
 
+_EXAMPLE_URL = "https://example.com"
+_EXAMPLE_URLS = ("https://example.com/1", "https://example.com/2")
+
 
 class TestResearchDepth:
     """Test ResearchDepth enum."""
@@ -46,19 +49,19 @@ class TestResearchQuery:
         assert query.research_depth == ResearchDepth.STANDARD
         assert query.max_sources == 5
     
-    def test_research_query_validation_max_sources(self):
+    @pytest.mark.parametrize("max_sources, valid", [
+        (10, True),
+        (0, False),  # too low
+        (100, False),  # too high
+    ])
+    def test_research_query_validation_max_sources(self, max_sources, valid):
         """Test validation of max_sources field."""
-        # Should work
-        query = ResearchQuery(query="test", max_sources=10)
-        assert query.max_sources == 10
-        
-        # Should fail - too low
-        with pytest.raises(ValidationError):
-            ResearchQuery(query="test", max_sources=0)
-        
-        # Should fail - too high
-        with pytest.raises(ValidationError):
-            ResearchQuery(query="test", max_sources=100)
+        if valid:
+            query = ResearchQuery(query="test", max_sources=max_sources)
+            assert query.max_sources == max_sources
+        else:
+            with pytest.raises(ValidationError):
+                ResearchQuery(query="test", max_sources=max_sources)
 
 
 class TestSearchResult:
@@ -67,32 +70,47 @@ class TestSearchResult:
     def test_search_result_creation(self):
         """Test creating a search result."""
         result = SearchResult(
-            url="https://example.com",
+            url=_EXAMPLE_URL,
             title="Test Article",
             snippet="This is a snippet",
             score=0.95,
         )
         
-        assert result.url == "https://example.com"
-        assert result.title == "Test Article"
-        assert result.snippet == "This is a snippet"
-        assert result.score == 0.95
+        assert result.model_dump() == {
+            "url": _EXAMPLE_URL,
+            "title": "Test Article",
+            "snippet": "This is a snippet",
+            "score": 0.95,
+        }
     
-    def test_search_result_to_dict(self):
+    def test_search_result_model_dump(self):
         """Test converting search result to dict."""
-        result = SearchResult(
-            url="https://example.com",
+        result = SearchResult.model_construct(
+            url=_EXAMPLE_URL,
             title="Test",
             snippet="Snippet",
             score=0.9,
         )
         
-        result_dict = result.to_dict()
+        result_dict = result.model_dump(mode="json")
         
-        assert result_dict["url"] == "https://example.com"
+        assert result_dict["url"] == _EXAMPLE_URL
         assert result_dict["title"] == "Test"
         assert result_dict["snippet"] == "Snippet"
         assert result_dict["score"] == 0.9
+    
+    def test_search_result_frozen(self):
+        """Test that search results are immutable and ignore extra fields."""
+        result = SearchResult(
+            url=_EXAMPLE_URL,
+            title="Test",
+            snippet="Snippet",
+            raw_content="ignored",
+        )
+        
+        assert not hasattr(result, "raw_content")
+        with pytest.raises(ValidationError):
+            result.title = "Changed"
 
 
 class TestWebpageContent:
@@ -101,25 +119,27 @@ class TestWebpageContent:
     def test_webpage_content_creation(self):
         """Test creating webpage content."""
         content = WebpageContent(
-            url="https://example.com",
+            url=_EXAMPLE_URL,
             title="Test Page",
             content="Page content here",
             author="John Doe",
             published_date="2024-01-15",
         )
         
-        assert content.url == "https://example.com"
-        assert content.title == "Test Page"
-        assert content.content == "Page content here"
-        assert content.author == "John Doe"
-        assert content.published_date == "2024-01-15"
-        assert content.success is True
-        assert content.error is None
+        assert content.model_dump(exclude={"extracted_at"}) == {
+            "url": _EXAMPLE_URL,
+            "title": "Test Page",
+            "content": "Page content here",
+            "author": "John Doe",
+            "published_date": "2024-01-15",
+            "success": True,
+            "error": None,
+        }
     
     def test_webpage_content_with_error(self):
         """Test webpage content with error."""
         content = WebpageContent(
-            url="https://example.com",
+            url=_EXAMPLE_URL,
             title="",
             content="",
             success=False,
@@ -129,21 +149,35 @@ class TestWebpageContent:
         assert content.success is False
         assert content.error == "404 Not Found"
     
-    def test_webpage_content_to_dict(self):
+    def test_webpage_content_model_dump(self):
         """Test converting webpage content to dict."""
-        content = WebpageContent(
-            url="https://example.com",
+        content = WebpageContent.model_construct(
+            url=_EXAMPLE_URL,
             title="Test",
             content="Content",
         )
         
-        content_dict = content.to_dict()
+        content_dict = content.model_dump(mode="json")
         
-        assert content_dict["url"] == "https://example.com"
+        assert content_dict["url"] == _EXAMPLE_URL
         assert content_dict["title"] == "Test"
         assert content_dict["content"] == "Content"
         assert content_dict["success"] is True
         assert "extracted_at" in content_dict
+    
+    def test_webpage_content_extracted_at(self):
+        """Test that the extraction time round-trips as an ISO string."""
+        extracted_at = datetime(2024, 1, 15, 10, 0)
+        content = WebpageContent(
+            url=_EXAMPLE_URL,
+            title="Test",
+            content="Content",
+            extracted_at=extracted_at,
+        )
+        
+        assert content.extracted_at == extracted_at
+        assert content.model_dump(mode="json")["extracted_at"] == "2024-01-15T10:00:00"
+        assert WebpageContent.model_validate_json(content.model_dump_json()).extracted_at == extracted_at
 
 
 class TestFinding:
@@ -154,43 +188,30 @@ class TestFinding:
         finding = Finding(
             claim="Vector databases are fast",
             evidence="According to benchmarks...",
-            source_urls=["https://example.com/1", "https://example.com/2"],
+            source_urls=list(_EXAMPLE_URLS),
             confidence=0.9,
         )
         
-        assert finding.claim == "Vector databases are fast"
-        assert finding.evidence == "According to benchmarks..."
-        assert len(finding.source_urls) == 2
-        assert finding.confidence == 0.9
+        assert finding.model_dump() == {
+            "claim": "Vector databases are fast",
+            "evidence": "According to benchmarks...",
+            "source_urls": list(_EXAMPLE_URLS),
+            "confidence": 0.9,
+        }
     
-    def test_finding_confidence_validation(self):
+    @pytest.mark.parametrize("confidence, valid", [
+        (0.5, True),
+        (-0.1, False),  # too low
+        (1.5, False),  # too high
+    ])
+    def test_finding_confidence_validation(self, confidence, valid):
         """Test confidence field validation."""
-        # Should work
-        finding = Finding(
-            claim="test",
-            evidence="test",
-            source_urls=[],
-            confidence=0.5,
-        )
-        assert finding.confidence == 0.5
-        
-        # Should fail - too low
-        with pytest.raises(ValidationError):
-            Finding(
-                claim="test",
-                evidence="test",
-                source_urls=[],
-                confidence=-0.1,
-            )
-        
-        # Should fail - too high
-        with pytest.raises(ValidationError):
-            Finding(
-                claim="test",
-                evidence="test",
-                source_urls=[],
-                confidence=1.5,
-            )
+        if valid:
+            finding = Finding(claim="test", evidence="test", source_urls=[], confidence=confidence)
+            assert finding.confidence == confidence
+        else:
+            with pytest.raises(ValidationError):
+                Finding(claim="test", evidence="test", source_urls=[], confidence=confidence)
 
 
 class TestResearchResult:
@@ -205,21 +226,24 @@ class TestResearchResult:
             sources_consulted=["https://example.com/1"],
         )
         
-        assert result.query == "test query"
-        assert result.summary == "This is the summary"
-        assert result.research_depth == ResearchDepth.STANDARD
-        assert len(result.sources_consulted) == 1
+        assert result.model_dump(exclude={"timestamp"}) == {
+            "query": "test query",
+            "summary": "This is the summary",
+            "key_findings": [],
+            "sources_consulted": ["https://example.com/1"],
+            "research_depth": ResearchDepth.STANDARD,
+        }
         assert isinstance(result.timestamp, datetime)
     
     def test_research_result_with_findings(self):
         """Test research result with findings."""
-        finding = Finding(
+        finding = Finding.model_construct(
             claim="Test claim",
             evidence="Test evidence",
-            source_urls=["https://example.com"],
+            source_urls=[_EXAMPLE_URL],
         )
         
-        result = ResearchResult(
+        result = ResearchResult.model_construct(
             query="test",
             summary="summary",
             research_depth=ResearchDepth.QUICK,
@@ -229,18 +253,35 @@ class TestResearchResult:
         assert len(result.key_findings) == 1
         assert result.key_findings[0].claim == "Test claim"
     
-    def test_research_result_to_dict(self):
+    def test_research_result_model_dump(self):
         """Test converting research result to dict."""
-        result = ResearchResult(
+        result = ResearchResult.model_construct(
             query="test query",
             summary="summary",
             research_depth=ResearchDepth.STANDARD,
+            key_findings=[
+                Finding.model_construct(claim="claim", evidence="evidence", source_urls=[_EXAMPLE_URL]),
+            ],
         )
         
-        result_dict = result.to_dict()
+        result_dict = result.model_dump(mode="json")
         
         assert result_dict["query"] == "test query"
         assert result_dict["summary"] == "summary"
         assert result_dict["research_depth"] == "standard"
-        assert "timestamp" in result_dict
-
+        assert result_dict["key_findings"][0]["claim"] == "claim"
+        assert result_dict["timestamp"] == result.timestamp.isoformat()
+    
+    def test_research_result_frozen(self):
+        """Test that research results and their findings are immutable."""
+        result = ResearchResult(
+            query="test",
+            summary="summary",
+            research_depth=ResearchDepth.QUICK,
+            key_findings=[Finding(claim="claim", evidence="evidence", source_urls=[_EXAMPLE_URL])],
+        )
+        
+        with pytest.raises(ValidationError):
+            result.summary = "Changed"
+        with pytest.raises(ValidationError):
+            result.key_findings[0].claim = "Changed"
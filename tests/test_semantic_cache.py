@@ -0,0 +1,140 @@
+"""Tests for the semantic result cache."""
+
+from unittest.mock import MagicMock, patch
+import pytest
+
+from src.models.data_models import ResearchDepth, ResearchResult
+from src.utils.semantic_cache import SemanticCache, get_semantic_cache
+
+EMBEDDINGS = {
+    "vector databases for RAG applications": [1.0, 0.0, 0.0],
+    "vector DBs for RAG": [0.95, 0.2, 0.0],
+    "history of the printing press": [0.0, 0.0, 1.0],
+}
+
+
+def fake_embed(query):
+    """Return a canned embedding for a query."""
+    return EMBEDDINGS[query]
+
+
+@pytest.fixture
+def semantic_cache(tmp_path):
+    """Create a semantic cache in a temporary directory."""
+    return SemanticCache(str(tmp_path), threshold=0.9, embed=fake_embed)
+
+
+@pytest.fixture
+def stored_result(semantic_cache):
+    """Store a result for the canonical query."""
+    result = ResearchResult(
+        query="vector databases for RAG applications",
+        summary="Vector databases store embeddings...",
+        research_depth=ResearchDepth.STANDARD,
+        sources_consulted=["https://example.com/1"],
+    )
+    embedding = semantic_cache.embed(result.query)
+    semantic_cache.store(embedding, "standard", 5, result)
+    return result
+
+
+class TestSemanticCache:
+    """Test SemanticCache class."""
+    
+    def test_lookup_empty(self, semantic_cache):
+        """Test lookup on an empty cache."""
+        embedding = semantic_cache.embed("vector DBs for RAG")
+        
+        assert semantic_cache.lookup(embedding, "standard", 5) is None
+    
+    def test_lookup_similar_query(self, semantic_cache, stored_result):
+        """Test that a near-duplicate query hits the cache."""
+        embedding = semantic_cache.embed("vector DBs for RAG")
+        
+        cached = semantic_cache.lookup(embedding, "standard", 5)
+        
+        assert cached.summary == stored_result.summary
+        assert cached.sources_consulted == stored_result.sources_consulted
+    
+    def test_lookup_dissimilar_query(self, semantic_cache, stored_result):
+        """Test that an unrelated query misses the cache."""
+        embedding = semantic_cache.embed("history of the printing press")
+        
+        assert semantic_cache.lookup(embedding, "standard", 5) is None
+    
+    def test_lookup_requires_same_settings(self, semantic_cache, stored_result):
+        """Test that depth and max_sources must match."""
+        embedding = semantic_cache.embed("vector DBs for RAG")
+        
+        assert semantic_cache.lookup(embedding, "comprehensive", 5) is None
+        assert semantic_cache.lookup(embedding, "standard", 10) is None
+    
+    def test_persists_across_instances(self, tmp_path, semantic_cache, stored_result):
+        """Test that stored results survive reopening the cache."""
+        reopened = SemanticCache(str(tmp_path), threshold=0.9, embed=fake_embed)
+        embedding = reopened.embed("vector DBs for RAG")
+        
+        assert reopened.lookup(embedding, "standard", 5).summary == stored_result.summary
+    
+    def test_max_entries(self, tmp_path, stored_result):
+        """Test that only the most recently stored results are kept."""
+        cache = SemanticCache(str(tmp_path), threshold=0.9, embed=fake_embed, max_entries=1)
+        
+        assert cache.lookup(cache.embed(stored_result.query), "standard", 5) == stored_result
+        
+        other = stored_result.model_copy(update={"query": "history of the printing press"})
+        cache.store(cache.embed(other.query), "standard", 5, other)
+        
+        assert cache.lookup(cache.embed(stored_result.query), "standard", 5) is None
+        reopened = SemanticCache(str(tmp_path), threshold=0.9, embed=fake_embed)
+        assert reopened.lookup(cache.embed(other.query), "standard", 5) == other
+    
+    def test_embed_failure(self, tmp_path):
+        """Test that embedding errors are treated as a miss."""
+        def failing_embed(query):
+            raise Exception("API error")
+        
+        cache = SemanticCache(str(tmp_path), threshold=0.9, embed=failing_embed)
+        
+        assert cache.embed("test") is None
+    
+    def test_get_semantic_cache_disabled(self, mock_config):
+        """Test that the semantic cache is off by default."""
+        assert get_semantic_cache(mock_config) is None
+    
+    @patch("src.utils.semantic_cache.OpenAI")
+    def test_get_semantic_cache_enabled(self, mock_openai_class, mock_config, tmp_path):
+        """Test creating the cache with the OpenAI embeddings API."""
+        mock_client = mock_openai_class.return_value
+        mock_client.embeddings.create.return_value.data = [MagicMock(embedding=[3.0, 4.0])]
+        config = mock_config.model_copy(
+            update={"semantic_cache_enabled": True, "cache_dir": str(tmp_path)}
+        )
+        
+        cache = get_semantic_cache(config)
+        embedding = cache.embed("test")
+        
+        assert list(embedding) == pytest.approx([0.6, 0.8])
+        mock_client.embeddings.create.assert_called_once_with(
+            model="text-embedding-3-small", input="test"
+        )
+
+
+class TestResearchAgentSemanticCache:
+    """Test semantic cache integration in ResearchAgent."""
+    
+    @patch("src.agent.Runner")
+    def test_research_uses_semantic_cache(self, mock_runner_class, agent, semantic_cache, monkeypatch):
+        """Test that research stores results and reuses them for similar queries."""
+        mock_result = MagicMock()
+        mock_result.final_output = "Research summary"
+        mock_runner_class.run_sync.return_value = mock_result
+        
+        monkeypatch.setattr(agent, "semantic_cache", semantic_cache)
+        
+        first = agent.research(query="vector databases for RAG applications")
+        second = agent.research(query="vector DBs for RAG")
+        
+        assert mock_runner_class.run_sync.call_count == 1
+        assert second.query == "vector DBs for RAG"
+        assert second.summary == first.summary
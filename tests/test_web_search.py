@@ -1,10 +1,11 @@
 """Tests for web search tool."""
 
-import json
+import asyncio
 from unittest.mock import MagicMock, patch
+import orjson
 import pytest
 
-from src.tools.web_search import _web_search_impl
+from src.tools.web_search import _web_search_impl, _web_search_many_impl
 from src.utils.config import Config
 
 
@@ -14,7 +15,7 @@ class TestWebSearchTool:
     def test_execute_empty_query(self):
         """Test execution with empty query."""
         result_json = _web_search_impl(query="")
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
         
         assert result["success"] is False
         assert "empty" in result["error"].lower()
@@ -23,7 +24,21 @@ class TestWebSearchTool:
     def test_execute_whitespace_query(self):
         """Test execution with whitespace-only query."""
         result_json = _web_search_impl(query="   ")
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
         
         assert result["success"] is False
         assert result["results"] == []
+    
+    def test_web_search_many(self, mock_config, mock_tavily_client):
+        """Test running several searches in one call."""
+        with patch('src.tools.web_search._config', mock_config), \
+                patch('src.tools.web_search._tavily_client', mock_tavily_client), \
+                patch('src.tools.web_search._cache', None):
+            result_json = asyncio.run(_web_search_many_impl(
+                ["vector databases", "RAG", "vector databases"], max_results=3,
+            ))
+        
+        results = orjson.loads(result_json)
+        assert [result["query"] for result in results] == ["vector databases", "RAG"]
+        assert all(result["success"] for result in results)
+        assert mock_tavily_client.search.call_count == 2
@@ -1,51 +1,75 @@
 """Tests for webpage fetcher tool."""
 
-import json
+import asyncio
+import socket
+from collections import OrderedDict
 from unittest.mock import MagicMock, patch
+import orjson
 import pytest
 import requests
 
-from src.tools.webpage_fetcher import (_fetch_webpage_impl, init_webpage_fetcher_tool, 
-                                        set_citation_manager)
+from src.tools.webpage_fetcher import (_fetch_webpage_impl, _fetch_webpages_impl,
+                                        init_webpage_fetcher_tool, set_citation_manager)
 import src.tools.webpage_fetcher as webpage_fetcher_module
+from src.utils.cache import ResultCache
 from src.utils.config import Config
 from src.utils.citation import CitationManager
 
 
+# Page bodies, built once for the whole module
+_HTML_SUCCESS = b"""
+<html>
+<head>
+    <title>Test Page</title>
+    <meta name="author" content="John Doe">
+    <meta name="date" content="2024-01-15">
+</head>
+<body>
+    <article>
+        <h1>Test Article</h1>
+        <p>This is test content.</p>
+    </article>
+</body>
+</html>
+"""
+_HTML_SCRIPTS = b"""
+<html>
+<head><title>Test</title></head>
+<body>
+    <script>alert('test');</script>
+    <style>.test { color: red; }</style>
+    <noscript>Please enable JavaScript</noscript>
+    <article>
+        <p>Main content here</p>
+    </article>
+</body>
+</html>
+"""
+_HTML_LONG = b"<html><body><article><p>" + b"A" * 10000 + b"</p></article></body></html>"
+_HTML_PARAGRAPHS = b"<html><head><title>Long</title></head><body><article>" + b"<p>paragraph</p>" * 100
+_HTML_CHARSET = "<html><head><title>Café</title></head><body><p>naïve</p></body></html>".encode()
+_HTML_META_CHARSET = (
+    '<html><head><meta charset="iso-8859-1"><title>Café</title></head><body></body></html>'
+).encode("latin-1")
+
+
 class TestWebpageFetcherTool:
     """Test fetch_webpage function tool."""
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
-    def test_execute_success(self, mock_config_global, mock_session_global, mock_config):
+    @pytest.fixture(autouse=True)
+    def fetcher_globals(self, mock_config, fetcher_session):
+        """Point the fetcher at the test config, the shared real session and fresh validators."""
+        with patch.object(webpage_fetcher_module, "_config", mock_config), \
+                patch.object(webpage_fetcher_module, "_session", fetcher_session), \
+                patch.object(webpage_fetcher_module, "_revalidation", OrderedDict()):
+            yield
+    
+    def test_execute_success(self, mocked_webpage):
         """Test successful webpage fetch."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b"""
-        <html>
-        <head>
-            <title>Test Page</title>
-            <meta name="author" content="John Doe">
-            <meta name="date" content="2024-01-15">
-        </head>
-        <body>
-            <article>
-                <h1>Test Article</h1>
-                <p>This is test content.</p>
-            </article>
-        </body>
-        </html>
-        """
-        
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-        
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
+        mocked_webpage.get("https://example.com/article", body=_HTML_SUCCESS, content_type="text/html")
         
         result_json = _fetch_webpage_impl(url="https://example.com/article")
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
         
         assert result["success"] is True
         assert result["url"] == "https://example.com/article"
@@ -53,156 +77,203 @@ class TestWebpageFetcherTool:
         assert "test content" in result["content"].lower()
         assert result["author"] == "John Doe"
         assert result["published_date"] == "2024-01-15"
+        assert "extracted_at" in result
     
     def test_execute_empty_url(self):
         """Test execution with empty URL."""
         result_json = _fetch_webpage_impl(url="")
-        result = json.loads(result_json)
+        result = orjson.loads(result_json)
         
         assert result["success"] is False
         assert "empty" in result["error"].lower()
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
-    def test_execute_timeout(self, mock_config_global, mock_session_global, mock_config):
-        """Test execution when request times out."""
-        mock_session = MagicMock()
-        mock_session.get.side_effect = requests.exceptions.Timeout()
-        
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
+    @pytest.mark.parametrize("response, expected_error", [
+        ({"body": requests.exceptions.Timeout()}, "timeout"),
+        ({"status": 404}, "404"),
+        ({"body": Exception("Network error")}, "network error"),
+    ])
+    def test_execute_errors(self, mocked_webpage, response, expected_error):
+        """Test execution when the request times out, returns an HTTP error, or fails."""
+        mocked_webpage.get("https://example.com/error", **response)
         
-        result_json = _fetch_webpage_impl(url="https://example.com")
-        result = json.loads(result_json)
+        result_json = _fetch_webpage_impl(url="https://example.com/error")
+        result = orjson.loads(result_json)
         
         assert result["success"] is False
-        assert "timeout" in result["error"].lower()
-        assert result["url"] == "https://example.com"
+        assert expected_error in result["error"].lower()
+        assert result["url"] == "https://example.com/error"
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
-    def test_execute_http_error(self, mock_config_global, mock_session_global, mock_config):
-        """Test execution when HTTP error occurs."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+    def test_content_extraction_removes_scripts(self, mocked_webpage):
+        """Test that scripts and styles are removed from content."""
+        mocked_webpage.get("https://example.com/scripts", body=_HTML_SCRIPTS, content_type="text/html")
         
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
+        result_json = _fetch_webpage_impl(url="https://example.com/scripts")
+        result = orjson.loads(result_json)
         
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
+        assert "alert" not in result["content"]
+        assert "color: red" not in result["content"]
+        assert "JavaScript" not in result["content"]
+        assert "Main content here" in result["content"]
+    
+    def test_content_length_limit(self, mocked_webpage):
+        """Test that content is limited to 5000 characters."""
+        mocked_webpage.get("https://example.com/long", body=_HTML_LONG, content_type="text/html")
         
-        result_json = _fetch_webpage_impl(url="https://example.com/notfound")
-        result = json.loads(result_json)
+        result_json = _fetch_webpage_impl(url="https://example.com/long")
+        result = orjson.loads(result_json)
         
-        assert result["success"] is False
-        assert "404" in result["error"]
-        assert result["url"] == "https://example.com/notfound"
+        # Content should be truncated
+        assert len(result["content"]) <= 5003  # 5000 + "..."
+        assert result["content"].endswith("...")
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
-    def test_execute_general_error(self, mock_config_global, mock_session_global, mock_config):
-        """Test execution when general error occurs."""
-        mock_session = MagicMock()
-        mock_session.get.side_effect = Exception("Network error")
+    def test_empty_page(self, mocked_webpage):
+        """Test that an empty 200 response yields an untitled, empty page."""
+        mocked_webpage.get("https://example.com/empty", body=b"", content_type="text/html")
         
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
+        result = orjson.loads(_fetch_webpage_impl(url="https://example.com/empty"))
         
-        result_json = _fetch_webpage_impl(url="https://example.com")
-        result = json.loads(result_json)
+        assert result["success"] is True
+        assert result["title"] == "Untitled"
+        assert result["content"] == ""
+    
+    def test_plain_text_page(self, mocked_webpage):
+        """Test that text/plain pages are read and truncated without HTML parsing."""
+        mocked_webpage.get(
+            "https://example.com/notes.txt",
+            body=b"First line  \n\n   second line\n" + b"A" * 10000,
+            content_type="text/plain; charset=utf-8",
+        )
         
-        assert result["success"] is False
-        assert "Network error" in result["error"]
+        with patch.object(webpage_fetcher_module, "_parse_response") as mock_parse:
+            result = orjson.loads(_fetch_webpage_impl(url="https://example.com/notes.txt"))
+        
+        mock_parse.assert_not_called()
+        assert result["success"] is True
+        assert result["title"] == "Untitled"
+        assert result["content"].startswith("First line\nsecond line\nAAA")
+        assert len(result["content"]) == 5003  # 5000 + "..."
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
-    def test_content_extraction_removes_scripts(self, mock_config_global, mock_session_global, mock_config):
-        """Test that scripts and styles are removed from content."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b"""
-        <html>
-        <head><title>Test</title></head>
-        <body>
-            <script>alert('test');</script>
-            <style>.test { color: red; }</style>
-            <article>
-                <p>Main content here</p>
-            </article>
-        </body>
-        </html>
-        """
-        
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-        
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
-        
-        result_json = _fetch_webpage_impl(url="https://example.com")
-        result = json.loads(result_json)
+    @pytest.mark.parametrize("content_type, body", [
+        ("text/html; charset=UTF-8", _HTML_CHARSET),
+        ("text/html; charset=ISO-8859-1", _HTML_CHARSET.decode().encode("latin-1")),
+        ("text/html; charset=no-such-charset", _HTML_CHARSET),
+        ("text/html", _HTML_CHARSET),
+        ("text/html", _HTML_META_CHARSET),
+    ], ids=["utf8", "latin1", "unknown", "undeclared", "meta"])
+    def test_charset_detection(self, mocked_webpage, content_type, body):
+        """Test that pages decode by header charset, then <meta charset>, then as UTF-8."""
+        mocked_webpage.get("https://example.com/charset", body=body, content_type=content_type)
         
-        assert "alert" not in result["content"]
-        assert "color: red" not in result["content"]
-        assert "Main content here" in result["content"]
+        result = orjson.loads(_fetch_webpage_impl(url="https://example.com/charset"))
+        
+        assert result["title"] == "Café"
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
-    def test_content_length_limit(self, mock_config_global, mock_session_global, mock_config):
-        """Test that content is limited to 5000 characters."""
-        long_content = "A" * 10000
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = f"""
-        <html>
-        <body><article><p>{long_content}</p></article></body>
-        </html>
-        """.encode()
+    @patch.object(webpage_fetcher_module, 'MAX_PAGE_BYTES', 100)
+    @patch.object(webpage_fetcher_module, 'CHUNK_SIZE', 16)
+    def test_page_download_limit(self, mocked_webpage):
+        """Test that long pages stop downloading after MAX_PAGE_BYTES."""
+        mocked_webpage.get("https://example.com/long", body=_HTML_PARAGRAPHS, content_type="text/html")
+        
+        result = orjson.loads(_fetch_webpage_impl(url="https://example.com/long"))
         
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
+        assert result["title"] == "Long"
+        assert result["content"].startswith("paragraph")
+        assert result["content"].count("paragraph") < 10
+        raw = mocked_webpage.calls[0].response.raw
+        assert raw.tell() < len(_HTML_PARAGRAPHS)  # streamed, not read up front
+        assert raw.closed
+    
+    def test_fetch_webpage_revalidation(self, mocked_webpage):
+        """Test that a known page is revalidated with a conditional GET."""
+        url = "https://example.com/versioned"
+        mocked_webpage.get(
+            url,
+            body="<html><head><title>Versioned</title></head><body><p>v1</p></body></html>",
+            content_type="text/html",
+            headers={"ETag": '"v1"'},
+        )
+        mocked_webpage.get(url, status=304)
+        citation_manager = CitationManager()
         
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
+        with patch.object(webpage_fetcher_module, "_citation_manager", citation_manager):
+            first = _fetch_webpage_impl(url=url)
+            citation_manager.clear()
+            second = _fetch_webpage_impl(url=url)
         
-        result_json = _fetch_webpage_impl(url="https://example.com")
-        result = json.loads(result_json)
+        assert first == second
+        assert "If-None-Match" not in mocked_webpage.calls[0].request.headers
+        assert mocked_webpage.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert citation_manager.count() == 1
+    
+    def test_fetch_webpage_revalidation_persisted(self, tmp_path, mocked_webpage):
+        """Test that validators persisted by an earlier run outlive the cached page."""
+        url = "https://example.com/versioned"
+        mocked_webpage.get(
+            url,
+            body="<html><head><title>Versioned</title></head><body><p>v1</p></body></html>",
+            content_type="text/html",
+            headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        mocked_webpage.get(url, status=304)
         
-        # Content should be truncated
-        assert len(result["content"]) <= 5003  # 5000 + "..."
-        assert result["content"].endswith("...")
+        # Cached pages expire at once, so only the validators can help
+        with patch.object(webpage_fetcher_module, "_cache", ResultCache(str(tmp_path), ttl=0)):
+            first = _fetch_webpage_impl(url=url)
+            webpage_fetcher_module._revalidation.clear()  # as if in a new process
+            second = _fetch_webpage_impl(url=url)
+        
+        assert first == second
+        assert mocked_webpage.calls[1].request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    
+    def test_revalidation_dropped_without_validators(self, tmp_path, mocked_webpage):
+        """Test that validators are forgotten once the page stops sending them."""
+        url = "https://example.com/versioned"
+        mocked_webpage.get(
+            url,
+            body="<html><head><title>Versioned</title></head><body><p>v1</p></body></html>",
+            content_type="text/html",
+            headers={"ETag": '"v1"'},
+        )
+        mocked_webpage.get(
+            url,
+            body="<html><head><title>Versioned</title></head><body><p>v2</p></body></html>",
+            content_type="text/html",
+        )
+        cache = ResultCache(str(tmp_path), ttl=0)
+        
+        with patch.object(webpage_fetcher_module, "_cache", cache):
+            _fetch_webpage_impl(url=url)
+            result = orjson.loads(_fetch_webpage_impl(url=url))
+        
+        assert result["content"] == "v2"
+        assert url not in webpage_fetcher_module._revalidation
+        assert cache.get(webpage_fetcher_module.REVALIDATION_NAMESPACE, url) is None
+    
+    def test_revalidation_entries_bounded(self):
+        """Test that only the most recently used validators are kept."""
+        with patch.object(webpage_fetcher_module, "MAX_REVALIDATION_ENTRIES", 2):
+            webpage_fetcher_module._store_revalidation("a", '"a"', None, "{}")
+            webpage_fetcher_module._store_revalidation("b", None, "Mon, 01 Jan 2024", "{}")
+            webpage_fetcher_module._get_revalidation("a")
+            webpage_fetcher_module._store_revalidation("c", '"c"', None, "{}")
+            webpage_fetcher_module._store_revalidation("d", None, None, "{}")
+        
+        assert list(webpage_fetcher_module._revalidation) == ["a", "c"]
     
-    @patch.object(webpage_fetcher_module, '_session')
-    @patch.object(webpage_fetcher_module, '_config')
     @patch.object(webpage_fetcher_module, '_citation_manager')
-    def test_citation_tracking(self, mock_citation_global, mock_config_global, mock_session_global, mock_config):
+    def test_citation_tracking(self, mock_citation_global, mocked_webpage):
         """Test that citations are tracked when citation manager is set."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b"""
-        <html>
-        <head><title>Test</title></head>
-        <body><p>Content</p></body>
-        </html>
-        """
-        
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-        
         citation_manager = CitationManager()
-        
-        webpage_fetcher_module._session = mock_session
-        webpage_fetcher_module._config = mock_config
         webpage_fetcher_module._citation_manager = citation_manager
         
-        _fetch_webpage_impl(url="https://example.com")
+        result = orjson.loads(_fetch_webpage_impl(url="https://example.com"))
         
         # Check that citation was added
+        assert result["content"] == "Content"
         assert citation_manager.count() == 1
         citation = citation_manager.get_citation(1)
         assert citation.url == "https://example.com"
+        assert citation.title == "Test"
     
     def test_init_webpage_fetcher_tool(self, mock_config):
         """Test initialization of webpage fetcher tool."""
@@ -211,10 +282,66 @@ class TestWebpageFetcherTool:
         # Check that globals were set
         assert webpage_fetcher_module._config is not None
         assert webpage_fetcher_module._session is not None
+        
+        assert "text/html" in webpage_fetcher_module._session.headers["Accept"]
+        adapter = webpage_fetcher_module._session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == webpage_fetcher_module.POOL_MAXSIZE
+        assert adapter.max_retries is webpage_fetcher_module.FETCH_RETRIES
+        assert webpage_fetcher_module._session.headers["User-Agent"] == mock_config.user_agent
+    
+    def test_session_created_once_without_init(self, mock_config):
+        """Test that an uninitialized fetcher creates one shared session."""
+        with patch.object(webpage_fetcher_module, "_config", None), \
+                patch.object(webpage_fetcher_module, "_session", None), \
+                patch.object(webpage_fetcher_module, "get_config", return_value=mock_config):
+            config, session = webpage_fetcher_module._get_session()
+            
+            assert config is mock_config
+            assert webpage_fetcher_module._get_session() == (config, session)
     
-    def test_set_citation_manager(self):
+    def test_init_with_dns_cache(self, mock_config, monkeypatch):
+        """Test that enabling the DNS cache reuses host lookups until they expire."""
+        monkeypatch.setattr(socket, "getaddrinfo", socket.getaddrinfo)
+        lookup = MagicMock(return_value=[("addrinfo",)])
+        monkeypatch.setattr(webpage_fetcher_module, "_original_getaddrinfo", lookup)
+        monkeypatch.setattr(webpage_fetcher_module, "_dns_cache", OrderedDict())
+        config = mock_config.model_copy(update={"dns_cache_enabled": True})
+        
+        init_webpage_fetcher_tool(config)
+        socket.getaddrinfo("example.com", 443)
+        socket.getaddrinfo("example.com", 443)
+        
+        assert socket.getaddrinfo is webpage_fetcher_module._cached_getaddrinfo
+        lookup.assert_called_once_with("example.com", 443)
+        
+        monkeypatch.setattr(webpage_fetcher_module, "DNS_CACHE_TTL", 0)
+        socket.getaddrinfo("example.org", 443)
+        socket.getaddrinfo("example.org", 443)
+        assert lookup.call_count == 3
+        
+        init_webpage_fetcher_tool(mock_config)
+        assert socket.getaddrinfo is lookup
+        assert not webpage_fetcher_module._dns_cache
+    
+    def test_set_citation_manager(self, restore_tool_globals):
         """Test setting citation manager."""
         citation_manager = CitationManager()
         set_citation_manager(citation_manager)
         
         assert webpage_fetcher_module._citation_manager is citation_manager
+    
+    def test_fetch_webpages(self):
+        """Test fetching several pages in one call."""
+        def fake_fetch(url):
+            return orjson.dumps({"success": True, "url": url}).decode()
+        
+        with patch.object(webpage_fetcher_module, "_fetch_webpage_impl", side_effect=fake_fetch) as mock_fetch:
+            result = asyncio.run(_fetch_webpages_impl([
+                "https://example.com/1",
+                "https://example.com/2",
+                "https://example.com/1",
+            ]))
+        
+        pages = orjson.loads(result)
+        assert [page["url"] for page in pages] == ["https://example.com/1", "https://example.com/2"]
+        assert mock_fetch.call_count == 2